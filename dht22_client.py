@@ -1,47 +1,233 @@
 import time
+import gzip
+import queue
+import random
+import logging
+import logging.handlers
+import socket
+import threading
+import orjson
 import requests
-import Adafruit_DHT as dht_sensor
+from requests.adapters import HTTPAdapter
+import board
+import adafruit_dht
 
 
 # -------------------------------------------------------
 # Config
 # -------------------------------------------------------
-LAPTOP_IP = "10.137.85.201"   # Change to your laptop's IP
-SERVER_URL = f"http://{LAPTOP_IP}:5000/dht22"
+LAPTOP_IP = "10.137.85.201"   # Change to your laptop's IP (a hostname works too)
+SERVER_PORT = 5000
+DNS_CACHE_TTL = 300  # Re-resolve LAPTOP_IP after a connection error if older than this (seconds)
 
-DHT_SENSOR_TYPE = dht_sensor.DHT22
-DHT_GPIO_PIN = 22  # GPIO 22, physical pin 15
+DHT_GPIO_PIN = board.D22  # GPIO 22, physical pin 15
+READ_INTERVAL = 5  # DHT22 needs at least 2 seconds between reads; 5 is safer
+
+# Unchanged readings are sent together, up to this many per POST
+# (12 x 5s = one POST per minute). A changed reading is sent straight away.
+BATCH_SIZE = 12
+
+# Only keep a reading if it moved at least this much since the last kept one
+TEMP_DELTA = 0.2       # °C
+HUMIDITY_DELTA = 1.0   # %
+# ...but always keep one (and flush the batch) at least this often, in seconds
+HEARTBEAT_INTERVAL = 60
+
+# Retry backoff after a failed POST (seconds)
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
 
 
 # -------------------------------------------------------
-# Main loop — reads temp & humidity and sends to server
+# Logging — written out by a background thread
 # -------------------------------------------------------
-print(f"DHT22 sender started — sending data to {SERVER_URL}")
+# Writing to stdout under journald can stall for tens of ms on the SD card.
+# The loops only put records on a queue; the listener thread does the write.
+log_queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
 
-while True:
-    # Read from the DHT22 sensor
-    # dht.read_retry tries a few times if the first read fails
-    humidity, temperature = dht_sensor.read_retry(DHT_SENSOR_TYPE, DHT_GPIO_PIN)
 
-    if humidity is not None and temperature is not None:
-        # Round to 1 decimal place
-        temp_rounded = round(temperature, 1)
-        hum_rounded = round(humidity, 1)
+# -------------------------------------------------------
+# HTTP session — keeps one connection open to the laptop
+# -------------------------------------------------------
+# A plain requests.post opens and closes a new TCP connection every time.
+# Reusing one Session lets every POST after the first skip the handshake.
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+
+# Drop requests' default User-Agent/Accept headers — on a tiny telemetry POST
+# they are bigger than the payload. Keep-alive is the HTTP/1.1 default anyway.
+session.headers.clear()
+
+# Body is pre-encoded with orjson and gzipped, so the headers are set by hand.
+# Level 1 is nearly free on the Pi and the repeated keys compress well.
+JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+GZIP_LEVEL = 1
+
+# DHT22 read through the kernel GPIO driver, so the Pi isn't busy-waiting
+# on the data line while a reading comes in
+dht_device = adafruit_dht.DHT22(DHT_GPIO_PIN, use_pulseio=True)
 
-        payload = {
-            "temperature": temp_rounded,
-            "humidity": hum_rounded
-        }
+def resolve_server_url():
+    """
+    Resolves LAPTOP_IP once and builds the /dht22 URL from the address,
+    so sends don't each start with a name lookup. Falls back to the
+    name as-is if the lookup fails.
+    """
+    try:
+        address = socket.gethostbyname(LAPTOP_IP)
+    except OSError as e:
+        logging.error(f"Could not resolve {LAPTOP_IP}: {e}")
+        address = LAPTOP_IP
 
+    return f"http://{address}:{SERVER_PORT}/dht22"
+
+
+# Readings from the sensor thread waiting to be batched and sent.
+# Bounded so a long network outage can't grow it forever.
+reading_queue = queue.Queue(maxsize=64)
+
+
+def sensor_loop():
+    """
+    Runs in a background thread and reads the DHT22 every READ_INTERVAL.
+    Slow sensor retries and slow network sends no longer hold each other up.
+    """
+    # Reads are scheduled on a fixed grid so the time spent reading
+    # doesn't push every following reading a little later
+    next_tick = time.monotonic()
+
+    while True:
         try:
-            requests.post(SERVER_URL, json=payload, timeout=2)
-            print(f"Sent → Temp: {temp_rounded}°C | Humidity: {hum_rounded}%")
+            temperature = dht_device.temperature
+            humidity = dht_device.humidity
+        except RuntimeError:
+            # Checksum or timing glitch — normal for a DHT22, try next tick
+            temperature = humidity = None
+
+        if humidity is not None and temperature is not None:
+            # Round to 1 decimal place
+            reading = (time.time(), round(temperature, 1), round(humidity, 1))
+
+            try:
+                reading_queue.put_nowait(reading)
+            except queue.Full:
+                # Sender is stuck — drop the oldest reading to make room
+                try:
+                    reading_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                reading_queue.put_nowait(reading)
+
+        else:
+            # This happens sometimes — DHT22 can miss a read occasionally
+            logging.warning(f"DHT22 read failed, will retry in {READ_INTERVAL} seconds...")
+
+        next_tick += READ_INTERVAL
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+
+
+# -------------------------------------------------------
+# Main loop — batches readings and sends them to server
+# -------------------------------------------------------
+server_url = resolve_server_url()
+resolved_at = time.monotonic()
+logging.info(f"DHT22 sender started — sending data to {server_url}")
+
+sensor_thread = threading.Thread(target=sensor_loop, daemon=True)
+sensor_thread.start()
+
+# Readings collected since the last successful send
+batch = []
+# Set once a changed reading is in the batch - the server only keeps the
+# newest sample, so that one shouldn't wait for the batch to fill up
+flush = False
+
+# Last reading that made it into a batch — used to drop unchanged readings
+last_kept_temp = None
+last_kept_hum = None
+last_kept_time = 0.0
+
+attempt = 0  # Consecutive failed sends
+
+while True:
+    # Wake up at least once per read interval so a stale batch still gets sent
+    try:
+        now, temp_rounded, hum_rounded = reading_queue.get(timeout=READ_INTERVAL)
+    except queue.Empty:
+        now = None
+
+    if now is not None:
+        changed = (
+            last_kept_temp is None
+            or abs(temp_rounded - last_kept_temp) >= TEMP_DELTA
+            or abs(hum_rounded - last_kept_hum) >= HUMIDITY_DELTA
+        )
+
+        # Skip readings that haven't really changed; the server keeps the
+        # last value anyway. The heartbeat still proves we're alive.
+        if changed or now - last_kept_time >= HEARTBEAT_INTERVAL:
+            batch.append({
+                "t": now,
+                "temperature": temp_rounded,
+                "humidity": hum_rounded
+            })
+            last_kept_temp = temp_rounded
+            last_kept_hum = hum_rounded
+            last_kept_time = now
+            flush = flush or changed  # The very first reading counts as changed
+
+    # Send when a reading changed, the batch is full, or its oldest reading is getting stale
+    if not batch or (not flush and len(batch) < BATCH_SIZE and time.time() - batch[0]["t"] < HEARTBEAT_INTERVAL):
+        continue
+
+    payload = {"samples": batch}
+
+    try:
+        body = gzip.compress(orjson.dumps(payload), compresslevel=GZIP_LEVEL)
+        response = session.post(server_url, data=body, headers=JSON_HEADERS, timeout=2)
+        response.raise_for_status()
+        last = payload["samples"][-1]
+        logging.info(f"Sent {len(payload['samples'])} readings → Temp: {last['temperature']}°C | Humidity: {last['humidity']}%")
+        # Only dropped once the server has them; a failed send retries them
+        batch = []
+        flush = False
+        attempt = 0
+
+    except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+        if isinstance(e, requests.HTTPError) and e.response.status_code < 500:
+            # The server rejected this batch (400 for a bad body) — sending
+            # the same readings again can't succeed, so they are dropped
+            logging.error(f"Server rejected {len(batch)} readings: {e}")
+            batch = []
+            flush = False
+            continue
+
+        # Transient network problem or server error — exponential backoff with full jitter
+        # spreads out retries so several Pis don't all hit a recovering
+        # server at the same moment. The sensor thread keeps reading meanwhile.
+        attempt += 1
+        del batch[:-BATCH_SIZE]  # Keep just the newest readings through a long outage
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+        logging.error(f"Could not send data: {e} — retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+        # The laptop may have picked up a new address from DHCP
+        if time.monotonic() - resolved_at >= DNS_CACHE_TTL:
+            server_url = resolve_server_url()
+            resolved_at = time.monotonic()
 
-        except Exception as e:
-            print(f"Could not send data: {e}")
+    except (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema, TypeError) as e:
+        # Bad server URL or an unserialisable payload — retrying can never
+        # succeed, so log once and stop instead of spamming the log forever
+        logging.error(f"Cannot send data, giving up: {e}")
+        break
 
-    else:
-        # This happens sometimes — DHT22 can miss a read occasionally
-        print("DHT22 read failed, will retry in 5 seconds...")
+    except requests.RequestException as e:
+        logging.error(f"Could not send data: {e}")
+        del batch[:-BATCH_SIZE]
 
-    time.sleep(5)  # DHT22 needs at least 2 seconds between reads; 5 is safer
+# Flush anything still queued before exiting
+log_listener.stop()
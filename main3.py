@@ -2,10 +2,21 @@ import cv2
 import numpy as np
 import tensorflow as tf
 from tensorflow.keras.models import load_model
-from collections import deque
+from collections import deque, Counter
 import threading
+import itertools
+import functools
+import queue
+import os
 import time
-from flask import Flask, request, jsonify, render_template_string, Response
+import gzip
+import zlib
+import hashlib
+import re
+import platform
+import orjson
+from flask import Flask, request, render_template_string, Response
+from werkzeug.serving import WSGIRequestHandler
 from datetime import datetime
 
 
@@ -39,10 +50,165 @@ except Exception as e:
 
 SEVERITY_CLASSES = ['healthy', 'high', 'low', 'medium']
 IMG_SIZE = (224, 224)
+# Downscaling the ROI to IMG_SIZE: INTER_AREA box-filters (cheap and
+# accurate for shrinking); INTER_NEAREST is faster still if accuracy holds
+RESIZE_INTERPOLATION = cv2.INTER_AREA
 BINARY_THRESHOLD = 0.6
 CONF_THRESHOLD = 45.0
 HIGH_CONF_THRESHOLD = 75.0
 
+# Without a GPU the models run as quantized TFLite instead of Keras
+USE_TFLITE = not gpus
+
+# Most camera frames per model call. Batching amortizes the GPU launch
+# overhead; on CPU it gains nothing and only adds latency.
+INFER_BATCH = 4 if gpus else 1
+# Once a batch has its first frame, how long to wait for more (seconds)
+BATCH_WINDOW = 0.03
+
+# Both the GPU graph and the TFLite models take raw uint8 pixels and scale
+# them to 0-1 themselves, so frames are never converted to float on the CPU
+# and only a quarter of the bytes cross to the GPU.
+MODEL_INPUT_DTYPE = np.uint8
+
+# Both models take the same 224x224 input, so run them together in one
+# traced graph. Calling the models directly also skips .predict()'s
+# per-call setup, which costs more than the models themselves at batch 1.
+# This path only runs on GPU, where XLA fuses the graph's kernels. It
+# compiles once per batch size, all of them during the warm-up below.
+@tf.function(input_signature=[tf.TensorSpec((None, IMG_SIZE[1], IMG_SIZE[0], 3), tf.uint8)], jit_compile=True)
+def fused_models(x):
+    x = tf.cast(x, tf.float32) * (1.0 / 255.0)
+    binary = binary_model(x, training=False)
+    severity = severity_model(x, training=False)
+    # Reduced to a plant score, class and confidence per frame on the GPU,
+    # so only those few numbers are copied back to the host
+    return (binary[:, 0],
+            tf.argmax(severity, axis=1, output_type=tf.int32),
+            tf.reduce_max(severity, axis=1) * 100.0)
+
+# Sample crops (any images) for calibrating full int8 quantization. Without
+# them ARM falls back to int8 weights with float activations.
+CALIBRATION_DIR = os.path.join(os.path.dirname(BINARY_MODEL_PATH), "calibration")
+CALIBRATION_SAMPLES = 100
+
+def calibration_images():
+    """Yields up to CALIBRATION_SAMPLES model inputs from CALIBRATION_DIR, preprocessed like camera frames."""
+    names = sorted(os.listdir(CALIBRATION_DIR))[:CALIBRATION_SAMPLES]
+    for name in names:
+        image = cv2.imread(os.path.join(CALIBRATION_DIR, name))
+        if image is None:
+            continue
+        image = cv2.resize(image, IMG_SIZE, interpolation=RESIZE_INTERPOLATION)
+        yield [image[np.newaxis]]
+
+def load_tflite(h5_path, keras_model):
+    """
+    Converts a Keras model to TFLite (cached next to the .h5 file) and
+    returns a ready interpreter. ARM gets int8 - fully, activations too, if
+    calibration images are available; x86 gets float16, since TFLite's int8
+    kernels are slow there. Either way the model takes uint8 pixels and
+    does the 0-1 scaling itself.
+    """
+    on_arm = platform.machine().lower() in ("aarch64", "arm64", "armv7l")
+    full_int8 = on_arm and os.path.isdir(CALIBRATION_DIR)
+    suffix = "_fullint8.tflite" if full_int8 else "_int8.tflite" if on_arm else "_fp16.tflite"
+    tflite_path = os.path.splitext(h5_path)[0] + "_u8in" + suffix
+
+    if not os.path.exists(tflite_path):
+        # Rescaling in front of the model, so the conversion to float happens
+        # inside the interpreter rather than as a separate pass over the frame
+        inputs = tf.keras.Input(keras_model.input_shape[1:], dtype=tf.uint8)
+        scaled = tf.keras.layers.Rescaling(1 / 255.0)(tf.cast(inputs, tf.float32))
+        converter = tf.lite.TFLiteConverter.from_keras_model(tf.keras.Model(inputs, keras_model(scaled)))
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if full_int8:
+            converter.representative_dataset = calibration_images
+            converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        elif not on_arm:
+            converter.target_spec.supported_types = [tf.float16]
+        with open(tflite_path, "wb") as f:
+            f.write(converter.convert())
+
+    # TFLite applies the XNNPACK delegate to float CPU models by default
+    interpreter = tf.lite.Interpreter(model_path=tflite_path, num_threads=os.cpu_count())
+    interpreter.allocate_tensors()
+    return interpreter
+
+# TensorRT engines for the fused graph, built once and kept on disk (the
+# build takes minutes). They are specific to the GPU they were built on.
+TRT_MODEL_DIR = os.path.splitext(SEVERITY_MODEL_PATH)[0] + "_fused_trt_top1"
+
+def load_trt():
+    """
+    Compiles the fused graph with TensorRT at FP16 and returns its serving
+    function, or None if this TensorFlow build can't use TensorRT.
+    """
+    if not os.path.isdir(TRT_MODEL_DIR):
+        try:
+            # Export the fused graph without XLA, which TensorRT can't convert
+            module = tf.Module()
+            module.binary_model, module.severity_model = binary_model, severity_model
+            export_fn = tf.function(fused_models.python_function, input_signature=fused_models.input_signature)
+            tf.saved_model.save(module, TRT_MODEL_DIR + "_src", signatures=export_fn.get_concrete_function())
+
+            converter = tf.experimental.tensorrt.Converter(
+                input_saved_model_dir=TRT_MODEL_DIR + "_src",
+                precision_mode="FP16",
+                maximum_cached_engines=INFER_BATCH)
+            converter.convert()
+            # One engine per batch size process_frame can send
+            converter.build(input_fn=lambda: (
+                (np.zeros((batch_size, IMG_SIZE[1], IMG_SIZE[0], 3), np.uint8),)
+                for batch_size in range(1, INFER_BATCH + 1)))
+            converter.save(TRT_MODEL_DIR)
+        except Exception as e:
+            print(f"WARNING: TensorRT unavailable, using XLA: {e}")
+            return None
+
+    return tf.saved_model.load(TRT_MODEL_DIR).signatures["serving_default"]
+
+def run_models(img):
+    """
+    Runs both models on a (N, 224, 224, 3) MODEL_INPUT_DTYPE batch and returns
+    numpy arrays of N binary scores, severity class ids and confidences (%).
+    """
+    if USE_TFLITE:
+        outputs = []
+        for interpreter, input_index, output_index in tflite_models:
+            interpreter.set_tensor(input_index, img)
+            interpreter.invoke()
+            outputs.append(interpreter.get_tensor(output_index))
+        binary_out, severity_out = outputs
+        return binary_out[:, 0], severity_out.argmax(axis=1), severity_out.max(axis=1) * 100
+
+    if fused_models_trt is not None:
+        outputs = fused_models_trt(x=tf.constant(img))
+        return outputs["output_0"].numpy(), outputs["output_1"].numpy(), outputs["output_2"].numpy()
+
+    return tuple(output.numpy() for output in fused_models_fn(tf.constant(img)))
+
+if USE_TFLITE:
+    binary_interpreter = load_tflite(BINARY_MODEL_PATH, binary_model)
+    severity_interpreter = load_tflite(SEVERITY_MODEL_PATH, severity_model)
+    # Tensor indices are looked up once; get_*_details() builds new dicts on every call
+    tflite_models = [(interpreter, interpreter.get_input_details()[0]['index'], interpreter.get_output_details()[0]['index'])
+                     for interpreter in (binary_interpreter, severity_interpreter)]
+    print("SUCCESS: Running models with TFLite")
+else:
+    fused_models_trt = load_trt()
+    if fused_models_trt is not None:
+        print("SUCCESS: Running models with TensorRT (FP16)")
+
+    # Calling the traced graph directly skips tf.function's argument
+    # matching and trace-cache lookup on every frame
+    fused_models_fn = fused_models.get_concrete_function()
+
+# Warm up at startup so the first camera frames aren't slow. Every batch
+# size gets a call, since each one is compiled separately.
+for batch_size in range(1, INFER_BATCH + 1):
+    run_models(np.zeros((batch_size, IMG_SIZE[1], IMG_SIZE[0], 3), MODEL_INPUT_DTYPE))
+
 # Target box size for AI analysis (300x300 center ROI)
 TARGET_SIZE = 300
 
@@ -76,6 +242,8 @@ SMOOTH_FRAMES = 20
 ALPHA = 0.1
 HYSTERESIS_THRESHOLD = 5
 history = deque(maxlen=SMOOTH_FRAMES)
+label_counts = Counter()  # Plant labels currently in history
+ema_conf = 0.0            # Running EMA of the confidences in history
 plant_state = False
 no_plant_count = 0
 
@@ -88,28 +256,102 @@ current_duration = 0
 latest_moisture = 0.0
 latest_temperature = None
 latest_humidity = None
-latest_plant_data = {"label": "No Plant Detected", "confidence": 0.0}
+latest_plant_data = {"label": "No Plant Detected", "confidence": 0.0, "severity": "No"}
 force_spray = False  # Global flag for force spray
+# Flask serves requests on several threads. Held while /process reads and
+# clears force_spray and picks its command, so one button press can't start
+# two force sprays and each reply carries the command worked out for it.
+spray_lock = threading.Lock()
 
 # ------------------------------
 # System Logs (max 50 entries)
 # ------------------------------
 system_logs = deque(maxlen=50)
+log_ids = itertools.count(1)  # Lets the dashboard ask for only the entries it hasn't seen
+SSE_HEARTBEAT = 3  # Seconds; keeps the dashboard's 5 s offline check happy when nothing changes
+# /events and /video_feed streams open at once; each holds a server thread
+# for as long as its tab is open, so past this many new ones get a 503
+MAX_STREAMS = 12
+# waitress worker threads, if it is installed - every stream slot plus
+# room for /process, /dht22 and the polled routes, which must never wait
+WSGI_THREADS = MAX_STREAMS + 8
+
+# Notified whenever there is something new for /events clients
+dashboard_update = threading.Condition()
+
+def notify_dashboards():
+    with dashboard_update:
+        dashboard_update.notify_all()
 
 def add_log(message, log_type="info"):
     """Add a log entry with timestamp"""
     timestamp = datetime.now().strftime("%H:%M:%S")
     system_logs.append({
+        "id": next(log_ids),
         "time": timestamp,
         "message": message,
         "type": log_type  # info, warning, success, error
     })
+    notify_dashboards()
 
 # ------------------------------
 # Frame Buffers
 # ------------------------------
-frame_buffer = deque(maxlen=1)
+frame_buffer = queue.Queue(maxsize=1)
 result_buffer = deque(maxlen=1)
+frame_ready = threading.Condition()  # Notified whenever result_buffer gets a new frame
+input_buffer = queue.Queue(maxsize=1)  # (frame, model input, ROI thumbnail) prepared ahead of inference
+encode_buffer = queue.Queue(maxsize=1)  # (annotated frame, label, color, confidence) waiting for JPEG encoding
+
+# Quality 75 is visually the same on the dashboard-sized stream and encodes
+# faster. Huffman optimisation is left off — it costs a second pass per frame.
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 75]
+STREAM_MAX_WIDTH = 960  # Wider frames are scaled down for /video_feed; the dashboard shows them smaller anyway
+
+# Frames whose 32x32 grayscale ROI thumbnail differs from the last inferred
+# one by less than this mean absolute difference (0-255) reuse that
+# prediction instead of running the models again. Unlike a bit hash this
+# also notices the leaf changing colour or brightness as a whole.
+THUMB_SIZE = (32, 32)
+DIFF_THRESHOLD = 3.0
+
+# Model input buffers, allocated once and reused for every frame. Two inputs
+# so one can be filled while the other is in inference.
+model_inputs = [np.empty((INFER_BATCH, IMG_SIZE[1], IMG_SIZE[0], 3), MODEL_INPUT_DTYPE) for _ in range(2)]
+
+def put_latest(q, item):
+    """Put item on a size-1 queue, replacing whatever is still waiting there"""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
+
+# Full-size images written into on every frame, allocated once
+# per use and shape instead of a fresh few MB per frame
+scratch_frames = {}
+
+def scratch_frame(name, shape):
+    """Reusable uint8 image for the given use and shape. Each use belongs to one thread."""
+    key = (name, shape)
+    if key not in scratch_frames:
+        scratch_frames[key] = np.empty(shape, np.uint8)
+    return scratch_frames[key]
+
+def encode_stream_frame(frame):
+    """
+    One multipart part for /video_feed: the frame scaled down to
+    STREAM_MAX_WIDTH and JPEG-encoded, with its headers. Built once per
+    frame, so each viewer's stream just sends the same bytes.
+    """
+    h, w = frame.shape[:2]
+    if w > STREAM_MAX_WIDTH:
+        stream_h = h * STREAM_MAX_WIDTH // w
+        frame = cv2.resize(frame, (STREAM_MAX_WIDTH, stream_h), dst=scratch_frame("stream", (stream_h, STREAM_MAX_WIDTH, 3)),
+                           interpolation=cv2.INTER_AREA)
+    ret, buffer = cv2.imencode('.jpg', frame, JPEG_PARAMS)
+    return b''.join((b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % buffer.nbytes,
+                     buffer.data, b'\r\n'))
 
 # ------------------------------
 # Freeze Mode and Spray Logic
@@ -118,18 +360,34 @@ freeze_mode = False
 frozen_frame = None
 spray_triggered = False
 spray_start_time = 0
+spray_end_time = 0  # time.monotonic() at which the current spray stops
 spray_duration = 0
 force_spray_message = ""  # Global for on-screen prompt
 
+def add_to_history(label, conf, repeats=1):
+    """Append a prediction repeats times, keeping label_counts and ema_conf in step with history"""
+    global ema_conf
+    was_empty = not history
+    for _ in range(repeats):
+        if len(history) == history.maxlen:
+            # deque drops the oldest entry on append — take it out of the counts first
+            old_label = history[0][0]
+            if old_label != "No Plant Detected":
+                label_counts[old_label] -= 1
+                if not label_counts[old_label]:
+                    del label_counts[old_label]
+        history.append((label, conf))
+    if label != "No Plant Detected":
+        label_counts[label] += repeats
+    # repeats EMA steps towards the same value, in closed form
+    ema_conf = conf if was_empty else conf + (1 - ALPHA) ** repeats * (ema_conf - conf)
+
 def get_smoothed_label():
     global plant_state, no_plant_count
     if not history:
         return "No Plant Detected", (0, 0, 255), 0.0
-    smoothed_conf = 0.0
-    for i, (_, conf) in enumerate(history):
-        smoothed_conf = conf if i == 0 else ALPHA * conf + (1 - ALPHA) * smoothed_conf
-    valid_labels = [lbl for lbl, _ in history if lbl != "No Plant Detected"]
-    most_common_label = max(set(valid_labels), key=valid_labels.count) if valid_labels else "No Plant Detected"
+    smoothed_conf = ema_conf
+    most_common_label = label_counts.most_common(1)[0][0] if label_counts else "No Plant Detected"
     if smoothed_conf >= CONF_THRESHOLD:
         plant_state = True
         no_plant_count = 0
@@ -147,16 +405,21 @@ def get_smoothed_label():
 # Spray Motor Function
 # ------------------------------
 def spray_motor(severity):
-    global spray_triggered, spray_start_time, spray_duration, motor_state, freeze_mode, force_spray_message
+    global spray_start_time, spray_end_time, spray_duration, motor_state
     if severity in SPRAY_RUN_TIMES:
         spray_duration = SPRAY_RUN_TIMES[severity]
-        spray_start_time = time.time()
+        spray_start_time = time.monotonic()
+        # Simulate motor run (in real, send command to Pi) — process_frame
+        # stops it once spray_end_time passes, no sleeping thread needed
+        spray_end_time = spray_start_time + spray_duration
         motor_state = True
         log_msg = f"Motor started for {spray_duration}s - {severity.upper()} severity detected"
         print(f"Starting spray for {spray_duration}s due to {severity} severity")
         add_log(log_msg, "success")
-        # Simulate motor run (in real, send command to Pi)
-        time.sleep(spray_duration)
+
+def stop_spray_if_done():
+    global spray_triggered, motor_state, freeze_mode, force_spray_message
+    if motor_state and time.monotonic() >= spray_end_time:
         motor_state = False
         print("Spray completed, motor stopped")
         add_log(f"Motor stopped after {spray_duration}s spray", "info")
@@ -168,12 +431,15 @@ def spray_motor(severity):
 # ------------------------------
 # UI Crosshair Drawing Function
 # ------------------------------
-def draw_target_ui(frame, target_size=TARGET_SIZE):
+@functools.lru_cache(maxsize=None)
+def render_target_ui(h, w, target_size):
     """
-    Draw a high-tech targeting crosshair UI on the frame.
-    Returns the frame with overlay and the ROI coordinates.
+    Draw the targeting crosshair UI once per frame size onto a blank canvas.
+    All the bracket, crosshair and grid geometry is worked out here, not per frame.
+    Returns the overlay image and a mask of the pixels it covers, both
+    cropped to the region of the frame they belong in, plus the ROI.
     """
-    h, w = frame.shape[:2]
+    frame = np.zeros((h, w, 3), np.uint8)
     
     # Calculate center ROI coordinates
     start_x = (w - target_size) // 2
@@ -237,154 +503,352 @@ def draw_target_ui(frame, target_size=TARGET_SIZE):
     cv2.putText(frame, f"{target_size}px", (start_x, start_y - 35),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.5, color_secondary, 1)
     
-    return frame, (start_x, start_y, end_x, end_y)
+    # Every color used above is non-black, so any lit pixel is overlay.
+    # Only the drawing's bounding box is kept, so the per-frame copy
+    # covers that box rather than the whole frame.
+    mask = frame.any(axis=2, keepdims=True)
+    ys, xs = np.nonzero(mask[:, :, 0])
+    region = (slice(ys.min(), ys.max() + 1), slice(xs.min(), xs.max() + 1))
+    return frame[region], mask[region], region, (start_x, start_y, end_x, end_y)
+
+def draw_target_ui(frame, target_size=TARGET_SIZE):
+    """
+    Draw a high-tech targeting crosshair UI on the frame.
+    Returns the frame with overlay and the ROI coordinates.
+    """
+    h, w = frame.shape[:2]
+    
+    # The overlay never changes for a given frame size — it is drawn once,
+    # then each frame is a single masked copy instead of ~30 OpenCV calls
+    overlay, mask, region, roi_coords = render_target_ui(h, w, target_size)
+    
+    np.copyto(frame[region], overlay, where=mask)
+    return frame, roi_coords
+
+# ------------------------------
+# Overlay Text
+# ------------------------------
+@functools.lru_cache(maxsize=512)
+def text_sprite(text, scale, color, thickness):
+    """
+    Rasterizes a line of overlay text once. Returns the glyph image, a mask
+    of its pixels and where putText's origin sits inside it.
+    """
+    (w, h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+    pad = thickness  # Strokes reach a little past the measured box
+    sprite = np.zeros((h + baseline + 2 * pad, w + 2 * pad, 3), np.uint8)
+    cv2.putText(sprite, text, (pad, h + pad), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+    # Overlay colors are never black and putText isn't antialiased here,
+    # so any lit pixel is glyph
+    return sprite, sprite.any(axis=2, keepdims=True), (pad, h + pad)
+
+def draw_text(frame, text, org, scale, color, thickness):
+    """
+    Same result as cv2.putText with FONT_HERSHEY_SIMPLEX, but the labels
+    repeat from frame to frame, so each one is only rasterized once.
+    """
+    sprite, mask, (origin_x, origin_y) = text_sprite(text, scale, color, thickness)
+    x, y = org[0] - origin_x, org[1] - origin_y
+    # Clipped at the frame's right/bottom edge, as putText would be
+    region = frame[y:y + sprite.shape[0], x:x + sprite.shape[1]]
+    h, w = region.shape[:2]
+    np.copyto(region, sprite[:h, :w], where=mask[:h, :w])
+
+# ------------------------------
+# Frame preprocessing thread
+# ------------------------------
+@functools.lru_cache(maxsize=None)
+def roi_bounds(h, w):
+    """Center TARGET_SIZE ROI (start_x, start_y, end_x, end_y), worked out once per frame size"""
+    start_x = (w - TARGET_SIZE) // 2
+    start_y = (h - TARGET_SIZE) // 2
+    return start_x, start_y, start_x + TARGET_SIZE, start_y + TARGET_SIZE
+
+def preprocess_frames():
+    """
+    Crops and scales camera frames for the models in its own thread, so the
+    next frame is already prepared while the current one is in inference.
+    """
+    slot = 0
+    while True:
+        # Wait until process_frame has taken the last input before filling
+        # the other one, so the input being filled is never in inference
+        input_buffer.join()
+
+        # One row per camera frame; the newest frame is the one displayed.
+        # The batch goes out when full or BATCH_WINDOW after its first frame.
+        for row in range(INFER_BATCH):
+            if row == 0:
+                frame = frame_buffer.get()
+                batch_end = time.monotonic() + BATCH_WINDOW
+            else:
+                try:
+                    frame = frame_buffer.get(timeout=max(0.0, batch_end - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            # Center ROI for AI analysis, resized to 224x224 straight
+            # into the reused buffers — no per-frame allocations
+            start_x, start_y, end_x, end_y = roi_bounds(*frame.shape[:2])
+            roi = frame[start_y:end_y, start_x:end_x]
+
+            # The models do the 0-1 scaling themselves, so resize straight into their input
+            resized = model_inputs[slot][row]
+            cv2.resize(roi, IMG_SIZE, dst=resized, interpolation=RESIZE_INTERPOLATION)
+            rows = row + 1
+
+        # Small grayscale thumbnail of the newest ROI, so unchanged scenes can skip inference
+        small = cv2.resize(resized, THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        thumb = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        input_buffer.put((frame, model_inputs[slot][:rows], thumb))
+        slot = 1 - slot
 
 # ------------------------------
 # Multi-threaded frame processing
 # ------------------------------
 def process_frame():
-    global motor_state, freeze_mode, spray_triggered
+    global motor_state, freeze_mode, spray_triggered, latest_plant_data
+    last_thumb = None  # Thumbnail of the last frame the models actually ran on
+    last_prediction = None
     while True:
-        if frame_buffer:
-            frame = frame_buffer.popleft()
-            
-            # Get frame dimensions
-            h, w = frame.shape[:2]
-            
-            # Calculate center ROI for AI analysis
-            start_x = (w - TARGET_SIZE) // 2
-            start_y = (h - TARGET_SIZE) // 2
-            end_x = start_x + TARGET_SIZE
-            end_y = start_y + TARGET_SIZE
-            
-            # Extract ROI for AI analysis only
-            roi = frame[start_y:end_y, start_x:end_x]
-            
-            # Prepare for model (resize ROI to 224x224)
-            img = cv2.resize(roi, IMG_SIZE).astype(np.float32) / 255.0
-            img = np.expand_dims(img, axis=0)
-            
-            # Step 1: Binary Model (Plant vs Non-Plant)
-            binary_pred = binary_model.predict(img, verbose=0)[0][0]
+        stop_spray_if_done()
+
+        # Wakes as soon as an input is ready, or when a running spray is due
+        # to stop; with the motor off it just blocks. Only this thread
+        # starts sprays, so the deadline can't change while it waits.
+        timeout = max(0.0, spray_end_time - time.monotonic()) if motor_state else None
+        try:
+            frame, img, thumb = input_buffer.get(timeout=timeout)
+            input_buffer.task_done()  # Lets preprocess_frames start the next one
+        except queue.Empty:
+            frame = None
+
+        if frame is not None:
+            # Center ROI for AI analysis
+            start_x, start_y, end_x, end_y = roi_bounds(*frame.shape[:2])
             
-            if binary_pred > BINARY_THRESHOLD:
-                # Step 2: Severity Model
-                preds = severity_model.predict(img, verbose=0)
-                class_id = int(np.argmax(preds))
-                confidence = float(np.max(preds) * 100)
-                label = f"{SEVERITY_CLASSES[class_id]} ({confidence:.1f}%)"
-                history.append((label, confidence))
+            # Scene hasn't changed since the last inference — reuse its result
+            repeat = last_thumb is not None and cv2.absdiff(thumb, last_thumb).mean() < DIFF_THRESHOLD
+            if repeat:
+                add_to_history(*last_prediction, repeats=len(img))
             else:
-                history.append(("No Plant Detected", 0.0))
+                # Binary + severity models in one fused call for the whole batch,
+                # already reduced to a score, class and confidence per frame
+                binary_scores, class_ids, confidences = run_models(img)
+                is_plant = binary_scores > BINARY_THRESHOLD
+
+                # One prediction per frame, oldest first
+                for plant, class_id, confidence in zip(is_plant.tolist(), class_ids.tolist(), confidences.tolist()):
+                    # Step 1: Binary Model (Plant vs Non-Plant)
+                    if plant:
+                        # Step 2: Severity Model
+                        label = f"{SEVERITY_CLASSES[class_id]} ({confidence:.1f}%)"
+                        last_prediction = (label, confidence)
+                    else:
+                        last_prediction = ("No Plant Detected", 0.0)
+
+                    add_to_history(*last_prediction)
+                last_thumb = thumb
             
             smoothed_label, smoothed_color, smoothed_conf = get_smoothed_label()
             
-            # Create a copy of the original HD frame for display
-            display_frame = frame.copy()
+            # The raw frame isn't needed after preprocessing, so draw the
+            # overlays straight onto it instead of a fresh 2.6 MB copy
+            display_frame = frame
             
             # Draw the targeting UI overlay on the full HD frame
             display_frame, roi_coords = draw_target_ui(display_frame, TARGET_SIZE)
             
             # Draw detection results overlay (positioned below the target box)
             result_y = end_y + 40
-            cv2.putText(display_frame, f"Plant: {smoothed_label}", (start_x, result_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, smoothed_color, 2)
+            draw_text(display_frame, f"Plant: {smoothed_label}", (start_x, result_y),
+                      0.7, smoothed_color, 2)
             
-            cv2.putText(display_frame, f"Confidence: {smoothed_conf:.1f}%", (start_x, result_y + 35),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            draw_text(display_frame, f"Confidence: {smoothed_conf:.1f}%", (start_x, result_y + 35),
+                      0.6, (255, 255, 255), 2)
             
-            # Update latest plant data for dashboard
-            latest_plant_data["label"] = smoothed_label
-            latest_plant_data["confidence"] = smoothed_conf
+            # Update latest plant data for dashboard. A new dict is swapped in
+            # rather than updating keys, so Flask threads never read a label
+            # from one frame with the confidence of another. The severity word
+            # is split off once here, not again on every /process call.
+            severity = smoothed_label.split(" ", 1)[0]
+            latest_plant_data = {"label": smoothed_label, "confidence": smoothed_conf, "severity": severity}
             
             # Auto Motor Trigger
-            severity = smoothed_label.split(" ")[0]
             if (severity in SPRAY_RUN_TIMES and
                 latest_moisture < MOISTURE_THRESHOLD and
                 (latest_humidity is not None and latest_humidity < HUMIDITY_THRESHOLD) and
                 (latest_temperature is not None and latest_temperature < TEMP_THRESHOLD) and
                 not motor_state):
-                threading.Thread(target=spray_motor, args=(severity,), daemon=True).start()
+                spray_motor(severity)
             
-            result_buffer.append((smoothed_label, smoothed_color, smoothed_conf, display_frame))
-        
-        time.sleep(0.01)
+            # Every captured frame is still streamed, even when the prediction
+            # was reused - the thumbnail only covers the centre ROI, and the
+            # rest of the scene can move while it stays the same.
+            # encode_frames JPEG-encodes it while the next frame is in inference.
+            # Waiting for the previous encode first keeps frames from piling up.
+            encode_buffer.join()
+            encode_buffer.put((display_frame, smoothed_label, smoothed_color, smoothed_conf))
+
+def encode_frames():
+    """
+    JPEG-encodes annotated frames in its own thread, overlapped with
+    inference on the next frame in process_frame.
+    """
+    frame_id = 0  # Lets generate_frames tell new frames from repeats
+    while True:
+        display, label, color, confidence = encode_buffer.get()
+        # Encode once here — every /video_feed client streams the same bytes
+        frame_part = encode_stream_frame(display)
+        encode_buffer.task_done()
+        frame_id += 1
+        with frame_ready:
+            result_buffer.append((label, color, confidence, frame_id, frame_part))
+            frame_ready.notify_all()
 
 def generate_frames():
+    last_id = None
     while True:
-        if result_buffer:
-            label, color, confidence, frame = result_buffer[-1]
-            
-            ret, buffer = cv2.imencode('.jpg', frame)
-            frame_bytes = buffer.tobytes()
-            
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-        time.sleep(0.03)
+        # Sleep until process_frame publishes a frame this client hasn't had yet
+        with frame_ready:
+            if frame_ready.wait_for(lambda: result_buffer and result_buffer[-1][3] != last_id, timeout=1.0):
+                label, color, confidence, frame_id, frame_part = result_buffer[-1]
+                last_id = frame_id
+            else:
+                # Nothing new (camera gone) - write something anyway, so a
+                # closed tab is noticed and its thread freed. Before the
+                # first frame a bare CRLF is just multipart preamble.
+                frame_part = result_buffer[-1][4] if result_buffer else b"\r\n"
+
+        # Written outside the lock, so a slow viewer never holds up encode_frames
+        yield frame_part
 
 # ------------------------------
 # Flask Routes
 # ------------------------------
+stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
+
+def slotted_stream(generator, mimetype, headers=None):
+    """Streaming response that holds one of the MAX_STREAMS slots until the server closes it, or a 503 if none is free"""
+    if not stream_slots.acquire(blocking=False):
+        return Response("Too many open streams", status=503, headers={'Retry-After': '5'})
+    response = Response(generator, mimetype=mimetype, headers=headers)
+    response.call_on_close(stream_slots.release)
+    return response
+
+# JSON bodies smaller than this aren't worth gzipping
+COMPRESS_MIN_SIZE = 512
+
+def fastjson(data):
+    """JSON response encoded with orjson, several times faster than jsonify for the polled endpoints.
+    Larger bodies (a full /logs list) are gzipped when the client accepts it."""
+    body = orjson.dumps(data)
+    headers = {'Vary': 'Accept-Encoding'}
+    if len(body) >= COMPRESS_MIN_SIZE and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        # Level 1 - the body is small and this runs on every poll
+        body = gzip.compress(body, compresslevel=1)
+        headers['Content-Encoding'] = 'gzip'
+    return Response(body, mimetype='application/json', headers=headers)
+
+# Prefixed to ETags so a cached response from before a restart never matches
+ETAG_PREFIX = f"{int(time.time()):x}"
+
+# no-cache lets the browser keep polled responses but makes it revalidate
+# each time with If-None-Match, so an unchanged poll costs an empty 304
+REVALIDATE_HEADERS = {'Cache-Control': 'no-cache'}
+
+def not_modified(etag):
+    """Empty 304 if the client already has this version of the response, otherwise None"""
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers={'ETag': etag, **REVALIDATE_HEADERS})
+    return None
+
+def with_etag(response, etag):
+    """Tags a polled response so the next identical poll can be answered by not_modified"""
+    response.headers['ETag'] = etag
+    response.headers.update(REVALIDATE_HEADERS)
+    return response
+
 @app.route('/process', methods=['POST'])
 def process():
     global current_command, current_duration, latest_moisture, force_spray
     data = request.json
     latest_moisture = data.get('moisture', 0.0)
     print(f"\n--- [PI DATA] Moisture: {latest_moisture}% ---")
-    plant_label = latest_plant_data.get("label", "").split(" ")[0]
+    plant_label = latest_plant_data["severity"]
     
-    # Check for force spray first
-    if force_spray:
-        current_command = "RUN"
-        current_duration = 3  # Force spray for 3 seconds
-        force_spray = False  # Reset after sending
-        print("Force spray activated via 'S' key -> Motor RUN for 3s")
-        add_log("Force spray activated - Motor RUN for 3s", "warning")
-    else:
-        # Normal logic: Plant detected AND all thresholds met
-        if (plant_label in SPRAY_RUN_TIMES and plant_label != "No Plant Detected" and
-            latest_moisture < MOISTURE_THRESHOLD and
-            (latest_humidity is not None and latest_humidity < HUMIDITY_THRESHOLD) and
-            (latest_temperature is not None and latest_temperature < TEMP_THRESHOLD)):
+    with spray_lock:
+        # Check for force spray first
+        if force_spray:
             current_command = "RUN"
-            current_duration = SPRAY_RUN_TIMES[plant_label]
-            print(f"Plant detected ({plant_label}), Conditions met -> Motor RUN for {current_duration}s")
-            add_log(f"Auto-trigger: {plant_label} severity, conditions met", "success")
+            current_duration = 3  # Force spray for 3 seconds
+            force_spray = False  # Reset after sending
+            print("Force spray activated via 'S' key -> Motor RUN for 3s")
+            add_log("Force spray activated - Motor RUN for 3s", "warning")
         else:
-            current_command = "STOP"
-            current_duration = 0
-            print("No action: Conditions not met")
+            # Normal logic: Plant detected AND all thresholds met
+            if (plant_label in SPRAY_RUN_TIMES and plant_label != "No Plant Detected" and
+                latest_moisture < MOISTURE_THRESHOLD and
+                (latest_humidity is not None and latest_humidity < HUMIDITY_THRESHOLD) and
+                (latest_temperature is not None and latest_temperature < TEMP_THRESHOLD)):
+                current_command = "RUN"
+                current_duration = SPRAY_RUN_TIMES[plant_label]
+                print(f"Plant detected ({plant_label}), Conditions met -> Motor RUN for {current_duration}s")
+                add_log(f"Auto-trigger: {plant_label} severity, conditions met", "success")
+            else:
+                current_command = "STOP"
+                current_duration = 0
+                print("No action: Conditions not met")
+        response = {"motor_command": current_command, "duration": current_duration}
     
-    return jsonify({"motor_command": current_command, "duration": current_duration})
+    notify_dashboards()  # New moisture reading
+    return fastjson(response)
 
 @app.route('/dht22', methods=['POST'])
 def dht22():
     global latest_temperature, latest_humidity
-    data = request.json
-    latest_temperature = data.get('temperature')
-    latest_humidity = data.get('humidity')
-    print(f"--- [DHT22 DATA] Temperature: {latest_temperature}C, Humidity: {latest_humidity}% ---")
-    return jsonify({"status": "received"})
+    body = request.get_data()
+    try:
+        # Batched bodies from the DHT22 client arrive gzip-compressed
+        if request.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        data = orjson.loads(body)
+    except (OSError, EOFError, zlib.error, orjson.JSONDecodeError):
+        data = None  # Truncated or corrupt body
+    # The DHT22 client batches readings as {"samples": [...]}; a single
+    # reading is still accepted. The newest sample is the current value.
+    samples = (data.get('samples') or [data]) if isinstance(data, dict) else None
+    if not isinstance(samples, list) or not all(isinstance(sample, dict) for sample in samples):
+        # The client's problem, not a server error
+        return fastjson({"status": "bad request"}), 400
+    latest_temperature = samples[-1].get('temperature')
+    latest_humidity = samples[-1].get('humidity')
+    print(f"--- [DHT22 DATA] Temperature: {latest_temperature}C, Humidity: {latest_humidity}% ({len(samples)} samples) ---")
+    notify_dashboards()
+    return fastjson({"status": "received"})
 
 @app.route('/logs')
 def get_logs():
-    """Return system logs"""
-    return jsonify(list(system_logs))
+    """Return system logs newer than ?since=<id> (all of them by default)"""
+    since = request.args.get('since', 0, type=int)
+    logs = list(system_logs)
+    # Ids restart with the server; a client that is ahead gets everything again
+    if logs and since > logs[-1]["id"]:
+        since = 0
 
-@app.route('/')
-def dashboard():
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Intelligent Sprayer System | Plant AI Monitor Pro</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
+    # The newest id identifies the log list, so an unchanged poll gets a 304
+    etag = f'"{ETAG_PREFIX}-{logs[-1]["id"] if logs else 0}"'
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    return with_etag(fastjson([log for log in logs if log["id"] > since]), etag)
+
+# The dashboard never changes while the server runs, so the page, its
+# stylesheet and its script are gzipped once at import instead of on every
+# request. The CSS and JS are served separately so the browser can cache them.
+DASHBOARD_CSS = """
         :root {
             --emerald-primary: #00f5a0; --emerald-dark: #00c97f; --emerald-light: #5fffd1; --emerald-glow: rgba(0, 245, 160, 0.45);
             --alert-red: #ff3b5c; --alert-red-dark: #d91e3f; --alert-red-glow: rgba(255, 59, 92, 0.45);
@@ -400,8 +864,10 @@ def dashboard():
             --gradient-danger: linear-gradient(135deg, #ff3b5c 0%, #d91e3f 100%);
             --gradient-warning: linear-gradient(135deg, #ffb020 0%, #ff8c00 100%);
             --gradient-info: linear-gradient(135deg, #3da9ff 0%, #2563eb 100%);
+            --gradient-panel: linear-gradient(145deg, var(--bg-glass-strong), var(--bg-card));
             --radius-sm: 10px; --radius-md: 16px; --radius-lg: 22px;
-            --transition-smooth: all 0.4s cubic-bezier(0.22, 1, 0.36, 1);
+            --transition-transform: transform 0.4s cubic-bezier(0.22, 1, 0.36, 1);
+            --transition-opacity: opacity 0.4s cubic-bezier(0.22, 1, 0.36, 1);
             --blur-glass: blur(18px); --blur-strong: blur(28px);
             --status-online: #00f5a0; --status-offline: #ff3b5c; --status-idle: #ffb020; --status-processing: #3da9ff;
         }
@@ -412,20 +878,22 @@ def dashboard():
             background: radial-gradient(circle at 20% 20%, rgba(0,245,160,0.05), transparent 40%), radial-gradient(circle at 80% 70%, rgba(61,169,255,0.05), transparent 50%), linear-gradient(145deg, var(--bg-darker), var(--bg-dark));
             color: var(--text-primary); min-height: 100vh; overflow-x: hidden; line-height: 1.6; letter-spacing: 0.2px; background-attachment: fixed;
         }
-        body::before { content: ""; position: fixed; inset: 0; pointer-events: none; background-image: linear-gradient(rgba(0, 245, 160, 0.05) 1px, transparent 1px), linear-gradient(90deg, rgba(0, 245, 160, 0.05) 1px, transparent 1px); background-size: 60px 60px; z-index: -1; opacity: 0.6; animation: gridDrift 40s linear infinite; }
+        body::before { content: ""; position: fixed; inset: 0; pointer-events: none; background-image: linear-gradient(rgba(0, 245, 160, 0.05) 1px, transparent 1px), linear-gradient(90deg, rgba(0, 245, 160, 0.05) 1px, transparent 1px); background-size: 60px 60px; z-index: -1; opacity: 0.6; animation: gridDrift 40s linear infinite; will-change: transform; }
         @keyframes gridDrift { 0% { transform: translate(0, 0); } 100% { transform: translate(-60px, -60px); } }
+        /* Icons hold a fixed-width box before Font Awesome arrives, so the late font doesn't shift the layout */
+        .fas { display: inline-block; width: 1.25em; text-align: center; }
         
         /* Header Animations */
-        .mission-header { background: linear-gradient(145deg, var(--bg-glass-strong), var(--bg-card)), radial-gradient(circle at 20% 50%, rgba(0, 245, 160, 0.08), transparent 60%); backdrop-filter: var(--blur-glass); border-bottom: 1px solid var(--border-light); box-shadow: var(--shadow-md), inset 0 -1px 0 rgba(0, 245, 160, 0.15); padding: 1.2rem 0; position: relative; overflow: hidden; z-index: 5; }
-        .mission-header::before { content: ""; position: absolute; bottom: 0; left: -50%; width: 50%; height: 2px; background: var(--gradient-primary); animation: headerScan 6s linear infinite; }
-        @keyframes headerScan { 0% { left: -50%; } 100% { left: 100%; } }
+        .mission-header { background: var(--gradient-panel), radial-gradient(circle at 20% 50%, rgba(0, 245, 160, 0.08), transparent 60%); backdrop-filter: var(--blur-glass); border-bottom: 1px solid var(--border-light); box-shadow: var(--shadow-md), inset 0 -1px 0 rgba(0, 245, 160, 0.15); padding: 1.2rem 0; position: relative; overflow: hidden; z-index: 5; }
+        .mission-header::before { content: ""; position: absolute; bottom: 0; left: 0; width: 50%; height: 2px; background: var(--gradient-primary); animation: headerScan 6s linear infinite; will-change: transform; }
+        @keyframes headerScan { 0% { transform: translate3d(-100%, 0, 0); } 100% { transform: translate3d(200%, 0, 0); } }
         .project-title { font-size: 1.6rem; font-weight: 800; letter-spacing: 1px; text-transform: uppercase; background: linear-gradient(135deg, #ffffff 0%, var(--text-primary) 40%, var(--emerald-light) 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; animation: titleGlow 3s ease-in-out infinite alternate; }
         @keyframes titleGlow { from { filter: drop-shadow(0 0 5px rgba(0, 245, 160, 0.3)); } to { filter: drop-shadow(0 0 15px rgba(0, 245, 160, 0.6)); } }
         .team-badge { background: var(--gradient-primary); color: #04110c; padding: 0.4rem 0.85rem; border-radius: 999px; font-size: 0.72rem; font-weight: 700; letter-spacing: 1.5px; text-transform: uppercase; border: 1px solid rgba(0, 245, 160, 0.35); box-shadow: 0 0 12px rgba(0, 245, 160, 0.35); animation: badgePulse 2s ease-in-out infinite; }
         @keyframes badgePulse { 0%, 100% { box-shadow: 0 0 12px rgba(0, 245, 160, 0.35); } 50% { box-shadow: 0 0 20px rgba(0, 245, 160, 0.6); } }
         
         /* Status Indicator */
-        .status-indicator { display: inline-flex; align-items: center; gap: 0.6rem; font-size: 0.85rem; font-weight: 600; color: var(--text-secondary); padding: 0.35rem 0.6rem; border-radius: var(--radius-sm); background: rgba(0, 245, 160, 0.04); border: 1px solid rgba(0, 245, 160, 0.08); backdrop-filter: var(--blur-glass); transition: all 0.3s ease; }
+        .status-indicator { display: inline-flex; align-items: center; gap: 0.6rem; font-size: 0.85rem; font-weight: 600; color: var(--text-secondary); padding: 0.35rem 0.6rem; border-radius: var(--radius-sm); background: rgba(0, 245, 160, 0.04); border: 1px solid rgba(0, 245, 160, 0.08); backdrop-filter: var(--blur-glass); transition: border-color 0.3s ease; }
         .status-dot { width: 10px; height: 10px; border-radius: 50%; background: var(--status-online); box-shadow: 0 0 8px var(--status-online), 0 0 16px rgba(0, 245, 160, 0.4); animation: pulseCore 2.5s ease-in-out infinite; position: relative; }
         .status-dot::before { content: ""; position: absolute; inset: -6px; border-radius: 50%; border: 1px solid rgba(0, 245, 160, 0.4); animation: pulseRing 2.5s ease-out infinite; }
         @keyframes pulseCore { 0%, 100% { transform: scale(1); box-shadow: 0 0 8px var(--status-online), 0 0 16px rgba(0, 245, 160, 0.4); } 50% { transform: scale(1.15); box-shadow: 0 0 14px var(--status-online), 0 0 28px rgba(0, 245, 160, 0.6); } }
@@ -434,19 +902,21 @@ def dashboard():
         @keyframes alertFlicker { 0%, 100% { opacity: 1; } 10% { opacity: 0.6; } 20% { opacity: 1; } 40% { opacity: 0.7; } 60% { opacity: 1; } 80% { opacity: 0.85; } }
         
         /* KPI Cards with Enhanced Animations */
-        .kpi-card { background: linear-gradient(145deg, var(--bg-glass-strong), var(--bg-card)); border: 1px solid var(--border-color); border-radius: var(--radius-md); padding: 1.6rem; position: relative; overflow: hidden; height: 100%; backdrop-filter: var(--blur-glass); box-shadow: var(--shadow-sm), inset 0 0 30px rgba(0, 245, 160, 0.02); transition: var(--transition-smooth); cursor: pointer; }
+        .kpi-card { background: var(--gradient-panel); border: 1px solid var(--border-color); border-radius: var(--radius-md); padding: 1.6rem; position: relative; overflow: hidden; contain: layout paint style; height: 100%; backdrop-filter: var(--blur-glass); box-shadow: var(--shadow-sm), inset 0 0 30px rgba(0, 245, 160, 0.02); transition: var(--transition-transform); will-change: transform; cursor: pointer; }
         .kpi-card::before { content: ""; position: absolute; top: 0; left: 0; width: 100%; height: 2px; background: linear-gradient(90deg, transparent 0%, var(--emerald-primary) 40%, var(--emerald-light) 50%, var(--emerald-primary) 60%, transparent 100%); transform: scaleX(0); transform-origin: left; transition: transform 0.45s cubic-bezier(0.22, 1, 0.36, 1); }
-        .kpi-card:hover { transform: translateY(-8px) scale(1.02); border-color: rgba(0, 245, 160, 0.4); box-shadow: 0 20px 50px rgba(0, 0, 0, 0.6), 0 0 30px rgba(0, 245, 160, 0.2); }
+        .kpi-card::after { content: ""; position: absolute; inset: 0; z-index: -1; border-radius: inherit; background: var(--gradient-primary); opacity: 0; transition: var(--transition-opacity); pointer-events: none; will-change: opacity; }
+        .kpi-card:hover { transform: translateY(-8px) scale(1.02); }
+        .kpi-card:hover::after { opacity: 0.15; }
         .kpi-card:hover::before { transform: scaleX(1); }
         .kpi-card.alert { border-color: rgba(255, 59, 92, 0.3); animation: alertBorderPulse 2s ease-in-out infinite; }
         .kpi-card.alert::before { background: linear-gradient(90deg, transparent 0%, var(--alert-red) 40%, #ff6b81 50%, var(--alert-red-dark) 60%, transparent 100%); }
-        .kpi-card.alert:hover { border-color: rgba(255, 59, 92, 0.6); box-shadow: 0 20px 50px rgba(0, 0, 0, 0.6), 0 0 30px rgba(255, 59, 92, 0.3); }
+        .kpi-card.alert::after { background: var(--gradient-danger); }
         @keyframes alertBorderPulse { 0%, 100% { border-color: rgba(255, 59, 92, 0.3); } 50% { border-color: rgba(255, 59, 92, 0.6); } }
         .kpi-card.warning { border-color: rgba(255, 176, 32, 0.3); animation: warningBorderPulse 2s ease-in-out infinite; }
         .kpi-card.warning::before { background: linear-gradient(90deg, transparent 0%, var(--warning-amber) 40%, #ffd166 50%, #ff9f1c 60%, transparent 100%); }
         @keyframes warningBorderPulse { 0%, 100% { border-color: rgba(255, 176, 32, 0.3); } 50% { border-color: rgba(255, 176, 32, 0.6); } }
         
-        .kpi-icon { width: 50px; height: 50px; border-radius: var(--radius-sm); display: flex; align-items: center; justify-content: center; font-size: 1.2rem; margin-bottom: 1.1rem; background: linear-gradient(145deg, rgba(0, 245, 160, 0.08), rgba(0, 245, 160, 0.03)); border: 1px solid rgba(0, 245, 160, 0.15); transition: var(--transition-smooth); }
+        .kpi-icon { width: 50px; height: 50px; border-radius: var(--radius-sm); display: flex; align-items: center; justify-content: center; font-size: 1.2rem; margin-bottom: 1.1rem; background: linear-gradient(145deg, rgba(0, 245, 160, 0.08), rgba(0, 245, 160, 0.03)); border: 1px solid rgba(0, 245, 160, 0.15); transition: var(--transition-transform); }
         .kpi-card:hover .kpi-icon { transform: scale(1.1) rotate(5deg); }
         .kpi-icon.healthy { background: linear-gradient(145deg, rgba(0, 245, 160, 0.18), rgba(0, 245, 160, 0.06)); color: var(--status-online); border-color: rgba(0, 245, 160, 0.25); box-shadow: 0 0 15px rgba(0, 245, 160, 0.2); animation: healthyPulse 2s ease-in-out infinite; }
         @keyframes healthyPulse { 0%, 100% { box-shadow: 0 0 15px rgba(0, 245, 160, 0.2); } 50% { box-shadow: 0 0 25px rgba(0, 245, 160, 0.4); } }
@@ -456,11 +926,12 @@ def dashboard():
         .kpi-icon.temperature { background: linear-gradient(145deg, rgba(255, 176, 32, 0.22), rgba(255, 140, 0, 0.08)); color: var(--status-idle); border-color: rgba(255, 176, 32, 0.35); }
         .kpi-icon.humidity { background: linear-gradient(145deg, rgba(6, 182, 212, 0.22), rgba(6, 182, 212, 0.08)); color: #22d3ee; border-color: rgba(6, 182, 212, 0.35); }
         .kpi-icon.pump { background: linear-gradient(145deg, rgba(139, 92, 246, 0.22), rgba(124, 58, 237, 0.08)); color: #a78bfa; border-color: rgba(139, 92, 246, 0.35); }
-        .kpi-icon.spraying { animation: pumpSpin 1s linear infinite; background: linear-gradient(145deg, rgba(0, 245, 160, 0.3), rgba(0, 201, 127, 0.15)); color: var(--emerald-primary); border-color: var(--emerald-primary); }
+        .kpi-card.motor-on .kpi-value { color: var(--emerald-primary); }
+        .kpi-card.motor-on .kpi-icon { animation: pumpSpin 1s linear infinite; will-change: transform; background: linear-gradient(145deg, rgba(0, 245, 160, 0.3), rgba(0, 201, 127, 0.15)); color: var(--emerald-primary); border-color: var(--emerald-primary); }
         @keyframes pumpSpin { from { transform: rotate(0deg); } to { transform: rotate(360deg); } }
         
         .kpi-label { font-size: 0.72rem; font-weight: 600; text-transform: uppercase; letter-spacing: 1.4px; color: var(--text-secondary); opacity: 0.85; margin-bottom: 0.55rem; }
-        .kpi-value { font-size: 1.9rem; font-weight: 800; letter-spacing: 0.5px; margin-bottom: 0.3rem; line-height: 1.1; transition: all 0.3s ease; }
+        .kpi-value { font-size: 1.9rem; font-weight: 800; letter-spacing: 0.5px; margin-bottom: 0.3rem; line-height: 1.1; transition: transform 0.3s ease; }
         .kpi-value.healthy { color: var(--status-online); text-shadow: 0 0 12px rgba(0, 245, 160, 0.25); animation: valueGlow 2s ease-in-out infinite alternate; }
         @keyframes valueGlow { from { text-shadow: 0 0 12px rgba(0, 245, 160, 0.25); } to { text-shadow: 0 0 20px rgba(0, 245, 160, 0.5); } }
         .kpi-value.infected { color: var(--status-offline); text-shadow: 0 0 14px rgba(255, 59, 92, 0.35); animation: valueAlert 1s ease-in-out infinite alternate; }
@@ -468,18 +939,19 @@ def dashboard():
         .kpi-value.warning { color: var(--status-idle); text-shadow: 0 0 14px rgba(255, 176, 32, 0.3); }
         .kpi-value.info { color: var(--status-processing); text-shadow: 0 0 14px rgba(61, 169, 255, 0.3); }
         .kpi-card:hover .kpi-value { transform: scale(1.05); }
-        .kpi-subtext { font-size: 0.85rem; font-weight: 500; color: var(--text-secondary); opacity: 0.8; transition: all 0.3s ease; }
+        .kpi-subtext { font-size: 0.85rem; font-weight: 500; color: var(--text-secondary); opacity: 0.8; transition: opacity 0.3s ease; }
         .kpi-card:hover .kpi-subtext { opacity: 1; color: var(--text-primary); }
         
         /* Operation Panel */
-        .operation-panel { background: linear-gradient(180deg, rgba(255, 255, 255, 0.02), rgba(255, 255, 255, 0.01)), var(--bg-card); border: 1px solid var(--border-color); border-radius: 20px; overflow: hidden; box-shadow: 0 8px 30px rgba(0, 0, 0, 0.25), inset 0 0 40px rgba(255, 255, 255, 0.02); transition: all 0.3s ease; }
+        .operation-panel { background: linear-gradient(180deg, rgba(255, 255, 255, 0.02), rgba(255, 255, 255, 0.01)), var(--bg-card); border: 1px solid var(--border-color); border-radius: 20px; overflow: hidden; contain: layout paint style; box-shadow: 0 8px 30px rgba(0, 0, 0, 0.25), inset 0 0 40px rgba(255, 255, 255, 0.02); transition: transform 0.3s ease; }
         .operation-panel:hover { transform: translateY(-4px); border-color: rgba(255, 255, 255, 0.12); box-shadow: 0 14px 50px rgba(0, 0, 0, 0.35); }
         .panel-header { background: linear-gradient(135deg, rgba(16, 185, 129, 0.12), rgba(16, 185, 129, 0.03) 40%, transparent 70%); padding: 1.1rem 1.6rem; border-bottom: 1px solid var(--border-color); display: flex; align-items: center; gap: 0.8rem; position: relative; }
         .panel-header::before { content: ""; position: absolute; left: 0; top: 0; bottom: 0; width: 4px; background: var(--emerald-primary); box-shadow: 0 0 18px rgba(16, 185, 129, 0.35); }
         .panel-header h5 { margin: 0; font-weight: 600; font-size: 1.05rem; color: var(--text-primary); }
         
         /* Live Feed with Enhanced Effects */
-        .live-feed-container { position: relative; background: radial-gradient(circle at center, rgba(0, 255, 180, 0.05), transparent 60%), #000; border-radius: 14px; overflow: hidden; aspect-ratio: 16 / 9; border: 1px solid rgba(255, 255, 255, 0.06); box-shadow: inset 0 0 40px rgba(0, 0, 0, 0.8), 0 8px 25px rgba(0, 0, 0, 0.35); transition: all 0.3s ease; }
+        .live-feed-container { position: relative; background: radial-gradient(circle at center, rgba(0, 255, 180, 0.05), transparent 60%), #000; border-radius: 14px; overflow: hidden; isolation: isolate; contain: layout size paint; aspect-ratio: 16 / 9; border: 1px solid rgba(255, 255, 255, 0.06); box-shadow: inset 0 0 40px rgba(0, 0, 0, 0.8), 0 8px 25px rgba(0, 0, 0, 0.35); transition: transform 0.3s ease; }
+        .live-feed-container > img { will-change: transform; }
         .live-feed-container:hover { transform: translateY(-3px); border-color: rgba(0, 255, 180, 0.25); box-shadow: inset 0 0 50px rgba(0, 0, 0, 0.85), 0 14px 40px rgba(0, 0, 0, 0.45); }
         .live-feed-container.infected { border: 3px solid var(--alert-red); box-shadow: 0 0 30px var(--alert-red-glow), 0 0 60px rgba(255, 59, 92, 0.25), inset 0 0 40px rgba(255, 59, 92, 0.15); animation: infectedFrame 1s ease-in-out infinite alternate; }
         @keyframes infectedFrame { from { box-shadow: 0 0 30px var(--alert-red-glow), inset 0 0 40px rgba(255, 59, 92, 0.15); } to { box-shadow: 0 0 50px var(--alert-red-glow), inset 0 0 60px rgba(255, 59, 92, 0.25); } }
@@ -487,33 +959,36 @@ def dashboard():
         @keyframes healthyFrame { from { box-shadow: 0 0 25px rgba(16, 185, 129, 0.25); } to { box-shadow: 0 0 40px rgba(16, 185, 129, 0.4); } }
         .live-feed-container.warning { border: 3px solid var(--warning-amber); box-shadow: 0 0 30px rgba(255, 176, 32, 0.35), inset 0 0 40px rgba(255, 176, 32, 0.12); animation: warningFrame 1.5s ease-in-out infinite alternate; }
         @keyframes warningFrame { from { box-shadow: 0 0 30px rgba(255, 176, 32, 0.35); } to { box-shadow: 0 0 50px rgba(255, 176, 32, 0.5); } }
-        .live-badge { position: absolute; top: 12px; left: 12px; background: linear-gradient(135deg, var(--alert-red), rgba(255, 59, 92, 0.85)); color: #fff; padding: 0.3rem 0.8rem; border-radius: 6px; font-size: 0.7rem; font-weight: 700; letter-spacing: 1.2px; backdrop-filter: blur(6px); box-shadow: 0 0 18px rgba(255, 59, 92, 0.45); z-index: 10; animation: livePulse 1.5s ease-in-out infinite; }
+        .live-badge { position: absolute; top: 12px; left: 12px; background: linear-gradient(135deg, var(--alert-red), rgba(255, 59, 92, 0.85)); color: #fff; padding: 0.3rem 0.8rem; border-radius: 6px; font-size: 0.7rem; font-weight: 700; letter-spacing: 1.2px; box-shadow: 0 0 18px rgba(255, 59, 92, 0.45); z-index: 10; animation: livePulse 1.5s ease-in-out infinite; }
         @keyframes livePulse { 0%, 100% { opacity: 1; transform: scale(1); } 50% { opacity: 0.8; transform: scale(1.05); } }
-        .detection-overlay { position: absolute; bottom: 12px; left: 12px; right: 12px; background: rgba(15, 23, 42, 0.9); backdrop-filter: blur(12px) saturate(150%); border: 1px solid rgba(16, 185, 129, 0.3); padding: 0.75rem 1rem; border-radius: 10px; display: flex; align-items: center; gap: 0.75rem; box-shadow: 0 0 15px rgba(16, 185, 129, 0.25); z-index: 10; transition: all 0.3s ease; }
+        .detection-overlay { position: absolute; bottom: 12px; left: 12px; right: 12px; background: rgba(15, 23, 42, 0.95); border: 1px solid rgba(16, 185, 129, 0.3); padding: 0.75rem 1rem; border-radius: 10px; display: flex; align-items: center; gap: 0.75rem; box-shadow: 0 0 15px rgba(16, 185, 129, 0.25); z-index: 10; }
         .detection-overlay.healthy { border-left: 4px solid var(--emerald-primary); box-shadow: 0 0 20px rgba(16, 185, 129, 0.4); }
         .detection-overlay.infected { border-left: 4px solid var(--alert-red); box-shadow: 0 0 20px rgba(239, 68, 68, 0.4); }
         .detection-overlay.warning { border-left: 4px solid var(--warning-amber); box-shadow: 0 0 20px rgba(245, 158, 11, 0.4); }
         .detection-status { display: flex; align-items: center; gap: 0.5rem; font-weight: 700; font-size: 0.875rem; text-transform: uppercase; letter-spacing: 0.5px; }
-        .detection-status.healthy { background: linear-gradient(90deg, var(--emerald-light), var(--emerald-primary)); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
-        .detection-status.infected { background: linear-gradient(90deg, #f87171, var(--alert-red)); -webkit-background-clip: text; -webkit-text-fill-color: transparent; animation: statusAlert 1s ease-in-out infinite alternate; }
-        @keyframes statusAlert { from { filter: brightness(1); } to { filter: brightness(1.3); } }
-        .detection-status.warning { background: linear-gradient(90deg, #fbbf24, var(--warning-amber)); -webkit-background-clip: text; -webkit-text-fill-color: transparent; }
+        .detection-status.healthy { color: var(--emerald-primary); }
+        .detection-status.infected { background: linear-gradient(90deg, #f87171, var(--alert-red)); -webkit-background-clip: text; -webkit-text-fill-color: transparent; will-change: opacity; animation: statusAlert 1s ease-in-out infinite alternate; }
+        @keyframes statusAlert { from { opacity: 0.8; } to { opacity: 1; } }
+        .detection-status.warning { color: var(--warning-amber); }
         .confidence-score { margin-left: auto; font-family: 'JetBrains Mono', monospace; font-size: 0.875rem; color: var(--text-secondary); }
         
         /* Activity Log */
-        .activity-log { background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 16px; overflow: hidden; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.15); }
+        .activity-log { background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 16px; overflow: hidden; content-visibility: auto; contain-intrinsic-size: auto 420px; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.15); }
         .log-header { background: linear-gradient(135deg, rgba(59, 130, 246, 0.15), rgba(16, 185, 129, 0.05)); padding: 1rem 1.25rem; border-bottom: 1px solid var(--border-color); display: flex; align-items: center; gap: 0.75rem; position: relative; }
-        .log-header::after { content: ''; position: absolute; bottom: 0; left: 0; width: 100%; height: 2px; background: linear-gradient(90deg, transparent, var(--info-blue), var(--emerald-light), transparent); animation: scanline 3s linear infinite; }
-        @keyframes scanline { 0% { transform: translateX(-100%); } 100% { transform: translateX(100%); } }
+        .log-header::after { content: ''; position: absolute; bottom: 0; left: 0; width: 100%; height: 2px; background: linear-gradient(90deg, transparent, var(--info-blue), var(--emerald-light), transparent); animation: slideAcross 3s linear infinite; will-change: transform; }
+        @keyframes slideAcross { 0% { transform: translate3d(-100%, 0, 0); } 100% { transform: translate3d(100%, 0, 0); } }
         .log-entries { max-height: 350px; overflow-y: auto; padding: 0.5rem; }
-        .log-entry { display: flex; align-items: flex-start; gap: 0.75rem; padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 0.5rem; background: rgba(16, 185, 129, 0.05); animation: slideIn 0.4s ease-out; border-left: 3px solid transparent; transition: all 0.3s ease; }
-        .log-entry:hover { background: rgba(16, 185, 129, 0.12); box-shadow: 0 0 15px var(--emerald-glow); transform: translateX(5px); }
+        /* Chart and log rows start below the fold; skip their layout and paint until scrolled near.
+           Set on the column so the chart's neon border, drawn just outside its box, isn't clipped. */
+        .below-fold { content-visibility: auto; contain-intrinsic-size: auto 420px; }
+        .log-entry { display: flex; align-items: flex-start; gap: 0.75rem; padding: 0.75rem 1rem; border-radius: 10px; margin-bottom: 0.5rem; background: rgba(16, 185, 129, 0.05); animation: slideIn 0.4s ease-out; border-left: 3px solid transparent; transition: transform 0.3s ease; content-visibility: auto; contain-intrinsic-size: auto 60px; }
+        .log-entry:hover { background: rgba(16, 185, 129, 0.12); box-shadow: 0 0 15px var(--emerald-glow); transform: translate3d(5px, 0, 0); }
         .log-entry.healthy { border-left-color: var(--emerald-primary); background: rgba(0, 245, 160, 0.08); }
         .log-entry.infected { border-left-color: var(--alert-red); background: rgba(255, 59, 92, 0.08); }
         .log-entry.warning { border-left-color: var(--warning-amber); background: rgba(255, 176, 32, 0.08); }
         .log-entry.info { border-left-color: var(--info-blue); background: rgba(61, 169, 255, 0.08); }
-        @keyframes slideIn { from { opacity: 0; transform: translateX(-20px); } to { opacity: 1; transform: translateX(0); } }
-        .log-icon { width: 36px; height: 36px; border-radius: 10px; display: flex; align-items: center; justify-content: center; flex-shrink: 0; transition: all 0.3s ease; }
+        @keyframes slideIn { from { opacity: 0; transform: translate3d(-20px, 0, 0); } to { opacity: 1; transform: translate3d(0, 0, 0); } }
+        .log-icon { width: 36px; height: 36px; border-radius: 10px; display: flex; align-items: center; justify-content: center; flex-shrink: 0; }
         .log-icon.success { background: rgba(16, 185, 129, 0.2); color: var(--emerald-primary); box-shadow: 0 0 10px var(--emerald-glow); }
         .log-icon.warning { background: rgba(245, 158, 11, 0.2); color: var(--warning-amber); box-shadow: 0 0 10px var(--warning-glow); }
         .log-icon.error { background: rgba(239, 68, 68, 0.2); color: var(--alert-red); box-shadow: 0 0 10px var(--alert-red-glow); }
@@ -522,28 +997,34 @@ def dashboard():
         .log-time { font-size: 0.75rem; color: var(--text-muted); font-family: 'JetBrains Mono', monospace; }
         
         /* Force Spray Button */
-        .force-spray-btn { width: 100%; padding: 1rem 1.5rem; border: none; border-radius: 12px; background: var(--gradient-danger); color: white; font-weight: 700; font-size: 1rem; text-transform: uppercase; letter-spacing: 1px; cursor: pointer; display: flex; align-items: center; justify-content: center; gap: 0.75rem; box-shadow: 0 0 15px rgba(239, 68, 68, 0.5); transition: all 0.3s ease; position: relative; overflow: hidden; animation: btnPulse 2s ease-in-out infinite; }
-        @keyframes btnPulse { 0%, 100% { box-shadow: 0 0 15px rgba(239, 68, 68, 0.5); } 50% { box-shadow: 0 0 30px rgba(239, 68, 68, 0.8); } }
-        .force-spray-btn::before { content: ''; position: absolute; top: 0; left: -100%; width: 100%; height: 100%; background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent); transition: left 0.5s; }
-        .force-spray-btn:hover::before { left: 100%; }
+        .force-spray-btn { width: 100%; padding: 1rem 1.5rem; border: none; border-radius: 12px; background: var(--gradient-danger); color: white; font-weight: 700; font-size: 1rem; text-transform: uppercase; letter-spacing: 1px; cursor: pointer; display: flex; align-items: center; justify-content: center; gap: 0.75rem; box-shadow: 0 0 15px rgba(239, 68, 68, 0.5); transition: transform 0.3s ease, opacity 0.3s ease; position: relative; }
+        .force-spray-btn::before { content: ''; position: absolute; inset: 0; border-radius: inherit; background: linear-gradient(90deg, transparent 33.3%, rgba(255,255,255,0.3) 50%, transparent 66.7%) 100% 0 / 300% 100% no-repeat; transition: background-position 0.5s; }
+        .force-spray-btn:hover::before { background-position: 0 0; }
+        .force-spray-btn::after { content: ''; position: absolute; inset: 0; border-radius: inherit; box-shadow: 0 0 30px rgba(239, 68, 68, 0.8); opacity: 0; pointer-events: none; will-change: opacity; animation: haloPulse 2s ease-in-out infinite; }
+        /* Shared fade for every glow halo; each halo sets its own timing */
+        @keyframes haloPulse { 0%, 100% { opacity: 0; } 50% { opacity: 1; } }
         .force-spray-btn:hover:not(:disabled) { transform: translateY(-3px) scale(1.03); box-shadow: 0 0 35px rgba(239, 68, 68, 0.9); }
-        .force-spray-btn:disabled { opacity: 0.6; cursor: not-allowed; animation: none; }
-        .force-spray-btn.spraying { background: var(--gradient-primary); box-shadow: 0 0 25px rgba(16, 185, 129, 0.7); animation: sprayingPulse 0.5s ease-in-out infinite; }
-        @keyframes sprayingPulse { 0%, 100% { box-shadow: 0 0 25px rgba(16, 185, 129, 0.7); } 50% { box-shadow: 0 0 40px rgba(16, 185, 129, 0.9); } }
+        .force-spray-btn:disabled { opacity: 0.6; cursor: not-allowed; }
+        .force-spray-btn:disabled::after { animation: none; }
+        .force-spray-btn.spraying { background: var(--gradient-primary); box-shadow: 0 0 25px rgba(16, 185, 129, 0.7); }
+        .force-spray-btn.spraying::after { box-shadow: 0 0 40px rgba(16, 185, 129, 0.9); animation: haloPulse 0.5s ease-in-out infinite; }
         
         /* Chart Container */
-        .chart-container { background: rgba(30, 41, 59, 0.85); border: 1px solid var(--emerald-glow); border-radius: 20px; padding: 1.5rem; height: 380px; box-shadow: 0 4px 20px rgba(16, 185, 129, 0.25); backdrop-filter: blur(12px); position: relative; }
-        .chart-container::before { content: ''; position: absolute; top: -2px; left: -2px; width: calc(100% + 4px); height: calc(100% + 4px); border-radius: 20px; border: 2px solid transparent; background: linear-gradient(45deg, #10b981, #34d399, #059669, #10b981); background-size: 400% 400%; animation: neon-border 6s linear infinite; z-index: -1; }
-        @keyframes neon-border { 0% { background-position: 0% 50%; } 50% { background-position: 100% 50%; } 100% { background-position: 0% 50%; } }
+        .chart-container { background: rgba(30, 41, 59, 0.85); border: 1px solid var(--emerald-glow); border-radius: 20px; padding: 1.5rem; height: 380px; box-shadow: 0 4px 20px rgba(16, 185, 129, 0.25); backdrop-filter: blur(12px); position: relative; contain: layout style; }
+        .chart-container::before { content: ''; position: absolute; top: -2px; left: -2px; width: calc(100% + 4px); height: calc(100% + 4px); border-radius: 20px; border: 2px solid transparent; background: linear-gradient(45deg, #10b981, #34d399, #059669, #10b981); will-change: opacity; animation: borderGlow 6s ease-in-out infinite; z-index: -1; }
+        /* Gradient borders breathe in opacity rather than scrolling their background */
+        @keyframes borderGlow { 0%, 100% { opacity: 1; } 50% { opacity: 0.6; } }
         
         /* Toast Notifications */
         .toast-container { position: fixed; bottom: 20px; right: 20px; z-index: 9999; display: flex; flex-direction: column; gap: 0.75rem; }
-        .custom-toast { background: rgba(30, 41, 59, 0.98); border: 1px solid var(--emerald-glow); border-radius: 14px; padding: 1rem 1.25rem; display: flex; align-items: center; gap: 0.75rem; box-shadow: 0 10px 40px rgba(16, 185, 129, 0.3); animation: toastSlideIn 0.4s ease-out forwards; font-weight: 600; min-width: 280px; backdrop-filter: blur(10px); }
-        @keyframes toastSlideIn { 0% { transform: translateX(100%); opacity: 0; } 100% { transform: translateX(0); opacity: 1; } }
-        .custom-toast.success { border-left: 4px solid var(--emerald-primary); background: rgba(0, 245, 160, 0.1); }
-        .custom-toast.error { border-left: 4px solid var(--alert-red); background: rgba(255, 59, 92, 0.1); }
-        .custom-toast.warning { border-left: 4px solid var(--warning-amber); background: rgba(255, 176, 32, 0.1); }
-        .custom-toast.info { border-left: 4px solid var(--info-blue); background: rgba(61, 169, 255, 0.1); }
+        .custom-toast { background: rgba(30, 41, 59, 0.98); border: 1px solid var(--emerald-glow); border-radius: 14px; padding: 1rem 1.25rem; display: flex; align-items: center; gap: 0.75rem; box-shadow: inset 0 0 0 1px rgba(0, 245, 160, 0.2), 0 10px 40px rgba(16, 185, 129, 0.3); animation: toastSlideIn 0.4s ease-out forwards; font-weight: 600; min-width: 280px; }
+        .custom-toast[hidden] { display: none; }
+        .custom-toast.entering { will-change: transform, opacity; }
+        @keyframes toastSlideIn { 0% { transform: translate3d(100%, 0, 0); opacity: 0; } 100% { transform: translate3d(0, 0, 0); opacity: 1; } }
+        .custom-toast.success { border-left: 4px solid var(--emerald-primary); background: linear-gradient(rgba(0, 245, 160, 0.1), rgba(0, 245, 160, 0.1)), rgba(10, 16, 28, 0.96); }
+        .custom-toast.error { border-left: 4px solid var(--alert-red); background: linear-gradient(rgba(255, 59, 92, 0.1), rgba(255, 59, 92, 0.1)), rgba(10, 16, 28, 0.96); }
+        .custom-toast.warning { border-left: 4px solid var(--warning-amber); background: linear-gradient(rgba(255, 176, 32, 0.1), rgba(255, 176, 32, 0.1)), rgba(10, 16, 28, 0.96); }
+        .custom-toast.info { border-left: 4px solid var(--info-blue); background: linear-gradient(rgba(61, 169, 255, 0.1), rgba(61, 169, 255, 0.1)), rgba(10, 16, 28, 0.96); }
         
         /* Scrollbar */
         ::-webkit-scrollbar { width: 10px; }
@@ -552,52 +1033,70 @@ def dashboard():
         ::-webkit-scrollbar-thumb:hover { background: linear-gradient(180deg, var(--emerald-light), var(--emerald-primary)); box-shadow: 0 0 15px var(--emerald-primary); }
         
         /* Overlay */
-        .tech-overlay-backdrop { position: fixed; inset: 0; background: rgba(4, 8, 15, 0.95); backdrop-filter: var(--blur-strong); z-index: 1000; opacity: 0; visibility: hidden; transition: all 0.4s cubic-bezier(0.22, 1, 0.36, 1); display: flex; align-items: center; justify-content: center; padding: 2rem; }
+        .tech-overlay-backdrop { position: fixed; inset: 0; contain: strict; background: rgba(4, 8, 15, 0.95); z-index: 1000; opacity: 0; visibility: hidden; transition: var(--transition-opacity), visibility 0.4s cubic-bezier(0.22, 1, 0.36, 1); display: flex; align-items: center; justify-content: center; padding: 2rem; }
         .tech-overlay-backdrop.active { opacity: 1; visibility: visible; }
-        .tech-info-overlay { position: relative; width: 100%; max-width: 600px; max-height: 85vh; overflow-y: auto; background: linear-gradient(145deg, var(--bg-glass-strong), var(--bg-card)), radial-gradient(circle at 30% 20%, rgba(0, 245, 160, 0.08), transparent 50%); border: 1px solid var(--border-light); border-radius: var(--radius-lg); padding: 2rem; backdrop-filter: var(--blur-glass); box-shadow: var(--shadow-lg), 0 0 60px rgba(0, 245, 160, 0.15); transform: translateY(30px) scale(0.95); opacity: 0; transition: all 0.5s cubic-bezier(0.22, 1, 0.36, 1); }
-        .tech-overlay-backdrop.active .tech-info-overlay { transform: translateY(0) scale(1); opacity: 1; }
-        .tech-info-overlay::before { content: ""; position: absolute; inset: 0; border-radius: var(--radius-lg); padding: 2px; background: linear-gradient(135deg, var(--emerald-primary) 0%, var(--info-blue) 25%, var(--automation-violet) 50%, var(--info-blue) 75%, var(--emerald-primary) 100%); background-size: 300% 300%; -webkit-mask: linear-gradient(#fff 0 0) content-box, linear-gradient(#fff 0 0); -webkit-mask-composite: xor; mask-composite: exclude; animation: borderGlow 4s ease infinite; pointer-events: none; }
-        @keyframes borderGlow { 0%, 100% { background-position: 0% 50%; } 50% { background-position: 100% 50%; } }
+        .tech-overlay-backdrop:not(.active) *, .tech-overlay-backdrop:not(.active) *::before, .tech-overlay-backdrop:not(.active) *::after { animation-play-state: paused; }
+        .tech-info-overlay { position: relative; width: 100%; max-width: 600px; max-height: 85vh; overflow-y: auto; background: var(--gradient-panel), radial-gradient(circle at 30% 20%, rgba(0, 245, 160, 0.08), transparent 50%); border: 1px solid var(--border-light); border-radius: var(--radius-lg); padding: 2rem; box-shadow: var(--shadow-lg), 0 0 60px rgba(0, 245, 160, 0.15); transform: translate3d(0, 30px, 0) scale(0.95); opacity: 0; transition: transform 0.5s cubic-bezier(0.22, 1, 0.36, 1), opacity 0.5s cubic-bezier(0.22, 1, 0.36, 1); }
+        .tech-overlay-backdrop.active .tech-info-overlay { transform: translate3d(0, 0, 0) scale(1); opacity: 1; }
+        .tech-info-overlay::before { content: ""; position: absolute; inset: 0; border-radius: var(--radius-lg); padding: 2px; background: linear-gradient(135deg, var(--emerald-primary) 0%, var(--info-blue) 25%, var(--automation-violet) 50%, var(--info-blue) 75%, var(--emerald-primary) 100%); -webkit-mask: linear-gradient(#fff 0 0) content-box, linear-gradient(#fff 0 0); -webkit-mask-composite: xor; mask-composite: exclude; will-change: opacity; animation: borderGlow 4s ease infinite; pointer-events: none; }
         .tech-corner { position: absolute; width: 20px; height: 20px; border: 2px solid var(--emerald-primary); opacity: 0.6; pointer-events: none; }
         .tech-corner-tl { top: 12px; left: 12px; border-right: none; border-bottom: none; }
         .tech-corner-tr { top: 12px; right: 12px; border-left: none; border-bottom: none; }
         .tech-corner-bl { bottom: 12px; left: 12px; border-right: none; border-top: none; }
         .tech-corner-br { bottom: 12px; right: 12px; border-left: none; border-top: none; }
         .tech-overlay-header { display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem; padding-bottom: 1rem; border-bottom: 1px solid var(--border-color); position: relative; }
-        .tech-overlay-icon { width: 56px; height: 56px; border-radius: var(--radius-sm); display: flex; align-items: center; justify-content: center; font-size: 1.4rem; background: linear-gradient(145deg, rgba(0, 245, 160, 0.15), rgba(0, 245, 160, 0.05)); border: 1px solid rgba(0, 245, 160, 0.25); animation: iconPulse 2s ease-in-out infinite; }
-        @keyframes iconPulse { 0%, 100% { box-shadow: inset 0 0 25px rgba(0, 245, 160, 0.1), 0 0 15px rgba(0, 245, 160, 0.2); } 50% { box-shadow: inset 0 0 35px rgba(0, 245, 160, 0.2), 0 0 25px rgba(0, 245, 160, 0.4); } }
-        .tech-overlay-close { width: 40px; height: 40px; border-radius: 50%; display: flex; align-items: center; justify-content: center; background: rgba(255, 59, 92, 0.1); border: 1px solid rgba(255, 59, 92, 0.3); color: var(--alert-red); font-size: 1.1rem; cursor: pointer; transition: var(--transition-smooth); }
+        .tech-overlay-icon { width: 56px; height: 56px; border-radius: var(--radius-sm); display: flex; align-items: center; justify-content: center; font-size: 1.4rem; background: linear-gradient(145deg, rgba(0, 245, 160, 0.15), rgba(0, 245, 160, 0.05)); border: 1px solid rgba(0, 245, 160, 0.25); box-shadow: inset 0 0 25px rgba(0, 245, 160, 0.1), 0 0 15px rgba(0, 245, 160, 0.2); position: relative; }
+        .tech-overlay-icon::after { content: ""; position: absolute; inset: -1px; border-radius: inherit; box-shadow: inset 0 0 35px rgba(0, 245, 160, 0.1), 0 0 25px rgba(0, 245, 160, 0.2); opacity: 0; pointer-events: none; will-change: opacity; animation: haloPulse 2s ease-in-out infinite; }
+        .tech-overlay-close { width: 40px; height: 40px; border-radius: 50%; display: flex; align-items: center; justify-content: center; background: rgba(255, 59, 92, 0.1); border: 1px solid rgba(255, 59, 92, 0.3); color: var(--alert-red); font-size: 1.1rem; cursor: pointer; transition: var(--transition-transform); }
         .tech-overlay-close:hover { background: rgba(255, 59, 92, 0.25); transform: rotate(90deg) scale(1.1); box-shadow: 0 0 20px rgba(255, 59, 92, 0.4); }
         .tech-data-grid { display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem; margin-bottom: 1.5rem; }
-        .tech-data-item { background: rgba(0, 245, 160, 0.05); border: 1px solid rgba(0, 245, 160, 0.1); border-radius: var(--radius-sm); padding: 1rem; transition: var(--transition-smooth); }
-        .tech-data-item:hover { background: rgba(0, 245, 160, 0.1); border-color: rgba(0, 245, 160, 0.25); transform: translateY(-3px); box-shadow: 0 5px 20px rgba(0, 245, 160, 0.15); }
+        .tech-data-item { background: rgba(0, 245, 160, 0.05); border: 1px solid rgba(0, 245, 160, 0.1); border-radius: var(--radius-sm); padding: 1rem; transition: var(--transition-transform); will-change: transform; }
+        .tech-data-item:hover { background: rgba(0, 245, 160, 0.1); border-color: rgba(0, 245, 160, 0.25); transform: translate3d(0, -3px, 0); box-shadow: 0 5px 20px rgba(0, 245, 160, 0.15); }
         .tech-data-label { font-size: 0.65rem; font-weight: 700; letter-spacing: 1.5px; text-transform: uppercase; color: var(--text-muted); margin-bottom: 0.4rem; }
         .tech-data-value { font-family: 'JetBrains Mono', monospace; font-size: 1.1rem; font-weight: 600; color: var(--text-primary); }
         .tech-status-badge { display: inline-flex; align-items: center; gap: 0.5rem; padding: 0.4rem 0.8rem; border-radius: 999px; font-size: 0.7rem; font-weight: 700; letter-spacing: 1px; text-transform: uppercase; background: rgba(0, 245, 160, 0.1); border: 1px solid rgba(0, 245, 160, 0.25); color: var(--emerald-primary); }
-        .tech-status-badge::before { content: ""; width: 8px; height: 8px; border-radius: 50%; background: var(--emerald-primary); animation: statusPulse 2s ease-in-out infinite; }
-        @keyframes statusPulse { 0%, 100% { opacity: 1; transform: scale(1); box-shadow: 0 0 8px var(--emerald-primary); } 50% { opacity: 0.7; transform: scale(1.3); box-shadow: 0 0 15px var(--emerald-primary); } }
+        .tech-status-badge::before { content: ""; width: 8px; height: 8px; border-radius: 50%; background: var(--emerald-primary); box-shadow: 0 0 8px var(--emerald-primary); animation: statusPulse 2s ease-in-out infinite; }
+        @keyframes statusPulse { 0%, 100% { opacity: 1; transform: scale(1); } 50% { opacity: 0.7; transform: scale(1.3); } }
         .tech-timestamp { font-family: 'JetBrains Mono', monospace; font-size: 0.75rem; color: var(--text-muted); }
         .tech-progress-container { margin-bottom: 1rem; }
         .tech-progress-label { display: flex; justify-content: space-between; font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.5rem; }
         .tech-progress-bar { height: 10px; background: rgba(255, 255, 255, 0.05); border-radius: 5px; overflow: hidden; position: relative; }
         .tech-progress-fill { height: 100%; border-radius: 5px; transition: width 0.8s cubic-bezier(0.22, 1, 0.36, 1); position: relative; overflow: hidden; }
-        .tech-progress-fill::after { content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0; background: linear-gradient(90deg, transparent, rgba(255,255,255,0.4), transparent); animation: shimmer 1.5s infinite; }
-        @keyframes shimmer { 0% { transform: translateX(-100%); } 100% { transform: translateX(100%); } }
+        .tech-progress-fill::after { content: ""; position: absolute; top: 0; left: 0; right: 0; bottom: 0; background: linear-gradient(90deg, transparent, rgba(255,255,255,0.4), transparent); animation: slideAcross 1.5s infinite; will-change: transform; }
         .tech-progress-fill.success { background: var(--gradient-primary); box-shadow: 0 0 15px var(--emerald-glow); }
         .tech-progress-fill.warning { background: var(--gradient-warning); box-shadow: 0 0 15px var(--warning-glow); }
         .tech-progress-fill.danger { background: var(--gradient-danger); box-shadow: 0 0 15px var(--alert-red-glow); }
         .stats-row { display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin: 1rem 0; }
-        .stat-box { text-align: center; padding: 1rem; background: rgba(0, 245, 160, 0.05); border-radius: var(--radius-sm); border: 1px solid rgba(0, 245, 160, 0.1); transition: all 0.3s ease; }
-        .stat-box:hover { transform: translateY(-3px); background: rgba(0, 245, 160, 0.08); box-shadow: 0 5px 20px rgba(0, 245, 160, 0.15); }
-        .stat-value { font-family: 'JetBrains Mono', monospace; font-size: 1.5rem; font-weight: 700; color: var(--text-primary); transition: all 0.3s ease; }
+        .overlay-panel { padding: 1rem; border-radius: 10px; border: 1px solid; }
+        .overlay-panel h6 { margin-bottom: 0.75rem; }
+        .overlay-panel p { color: var(--text-secondary); font-size: 0.9rem; margin: 0; }
+        .overlay-panel.healthy { background: rgba(0, 245, 160, 0.08); border-color: rgba(0, 245, 160, 0.2); }
+        .overlay-panel.healthy h6 { color: var(--emerald-primary); }
+        .overlay-panel.alert { background: rgba(255, 59, 92, 0.08); border-color: rgba(255, 59, 92, 0.2); }
+        .overlay-panel.alert h6 { color: var(--alert-red); }
+        .overlay-panel.info { background: rgba(61, 169, 255, 0.08); border-color: rgba(61, 169, 255, 0.2); }
+        .overlay-panel.info h6 { color: var(--info-blue); }
+        .overlay-panel.cyan { background: rgba(6, 182, 212, 0.08); border-color: rgba(6, 182, 212, 0.2); }
+        .overlay-panel.cyan h6 { color: #22d3ee; }
+        .overlay-panel.violet { background: rgba(139, 92, 246, 0.08); border-color: rgba(139, 92, 246, 0.2); }
+        .overlay-panel.violet h6 { color: var(--automation-violet); }
+        .overlay-params { display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; font-size: 0.85rem; }
+        .overlay-params span:first-child { color: var(--text-muted); }
+        .overlay-params span + span { color: var(--text-primary); }
+        .spray-history-row { display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid var(--border-color); font-size: 0.8rem; color: var(--text-secondary); }
+        .spray-history-row .manual { color: var(--warning-amber); }
+        .spray-history-row .auto { color: var(--emerald-primary); }
+        .stat-box { text-align: center; padding: 1rem; background: rgba(0, 245, 160, 0.05); border-radius: var(--radius-sm); border: 1px solid rgba(0, 245, 160, 0.1); transition: transform 0.3s ease; will-change: transform; }
+        .stat-box:hover { transform: translate3d(0, -3px, 0); background: rgba(0, 245, 160, 0.08); box-shadow: 0 5px 20px rgba(0, 245, 160, 0.15); }
+        .stat-value { font-family: 'JetBrains Mono', monospace; font-size: 1.5rem; font-weight: 700; color: var(--text-primary); transition: transform 0.3s ease; }
         .stat-box:hover .stat-value { transform: scale(1.1); }
         .stat-label { font-size: 0.65rem; color: var(--text-muted); text-transform: uppercase; letter-spacing: 1px; margin-top: 0.25rem; }
         
         /* Spray Duration Panel */
-        .spray-duration-panel { background: linear-gradient(145deg, var(--bg-glass-strong), var(--bg-card)); border: 1px solid var(--border-color); border-radius: var(--radius-md); padding: 1.5rem; height: 100%; backdrop-filter: var(--blur-glass); box-shadow: var(--shadow-sm), inset 0 0 30px rgba(0, 245, 160, 0.02); transition: all 0.3s ease; }
+        .spray-duration-panel { background: var(--gradient-panel); border: 1px solid var(--border-color); border-radius: var(--radius-md); padding: 1.5rem; height: 100%; contain: layout style; box-shadow: var(--shadow-sm), inset 0 0 30px rgba(0, 245, 160, 0.02); transition: border-color 0.3s ease; }
         .spray-duration-panel:hover { border-color: rgba(0, 245, 160, 0.3); box-shadow: 0 15px 40px rgba(0, 0, 0, 0.5), 0 0 25px rgba(0, 245, 160, 0.15); }
-        .duration-item { display: flex; align-items: center; justify-content: space-between; padding: 0.85rem 1rem; margin-bottom: 0.75rem; border-radius: var(--radius-sm); background: rgba(255, 255, 255, 0.03); border: 1px solid rgba(255, 255, 255, 0.05); transition: all 0.3s ease; }
-        .duration-item:hover { transform: translateX(8px); background: rgba(255, 255, 255, 0.06); }
+        .duration-item { display: flex; align-items: center; justify-content: space-between; padding: 0.85rem 1rem; margin-bottom: 0.75rem; border-radius: var(--radius-sm); background: rgba(255, 255, 255, 0.03); border: 1px solid rgba(255, 255, 255, 0.05); transition: transform 0.3s ease; will-change: transform; }
+        .duration-item:hover { transform: translate3d(8px, 0, 0); background: rgba(255, 255, 255, 0.06); }
         .duration-item.low { border-left: 4px solid var(--warning-amber); }
         .duration-item.medium { border-left: 4px solid #f97316; }
         .duration-item.high { border-left: 4px solid var(--alert-red); }
@@ -608,292 +1107,91 @@ def dashboard():
         .duration-time { font-family: 'JetBrains Mono', monospace; font-size: 1.3rem; font-weight: 700; color: var(--text-primary); }
         
         /* Force Spray Section */
-        .force-spray-section { background: linear-gradient(145deg, rgba(255, 59, 92, 0.1), rgba(255, 59, 92, 0.03)); border: 1px solid rgba(255, 59, 92, 0.25); border-radius: var(--radius-md); padding: 1.5rem; margin-bottom: 1.5rem; backdrop-filter: var(--blur-glass); transition: all 0.3s ease; animation: sectionPulse 3s ease-in-out infinite; }
-        @keyframes sectionPulse { 0%, 100% { border-color: rgba(255, 59, 92, 0.25); box-shadow: 0 0 20px rgba(255, 59, 92, 0.1); } 50% { border-color: rgba(255, 59, 92, 0.4); box-shadow: 0 0 30px rgba(255, 59, 92, 0.2); } }
-        .force-spray-section:hover { border-color: rgba(255, 59, 92, 0.5); box-shadow: 0 10px 40px rgba(255, 59, 92, 0.25); animation: none; }
+        .force-spray-section { background: linear-gradient(145deg, rgba(255, 59, 92, 0.1), rgba(255, 59, 92, 0.03)); border: 1px solid rgba(255, 59, 92, 0.25); border-radius: var(--radius-md); padding: 1.5rem; margin-bottom: 1.5rem; box-shadow: 0 0 20px rgba(255, 59, 92, 0.1); transition: border-color 0.3s ease; position: relative; contain: layout style; }
+        .force-spray-section::after { content: ""; position: absolute; inset: -1px; border-radius: inherit; border: 1px solid rgba(255, 59, 92, 0.2); box-shadow: 0 0 30px rgba(255, 59, 92, 0.12); opacity: 0; pointer-events: none; will-change: opacity; animation: haloPulse 3s ease-in-out infinite; }
+        .force-spray-section:hover { border-color: rgba(255, 59, 92, 0.5); box-shadow: 0 10px 40px rgba(255, 59, 92, 0.25); }
+        .force-spray-section:hover::after { animation: none; }
         
         /* Loading Spinner */
-        .loading-spinner { width: 24px; height: 24px; border: 3px solid rgba(16, 185, 129, 0.2); border-top-color: var(--emerald-light); border-radius: 50%; animation: spin 1s linear infinite; }
-        @keyframes spin { to { transform: rotate(360deg); } }
-        
-        /* Data Update Animation */
-        .data-updated { animation: dataFlash 0.5s ease-out; }
-        @keyframes dataFlash { 0% { background: rgba(0, 245, 160, 0.3); } 100% { background: transparent; } }
+        .loading-spinner { width: 24px; height: 24px; border: 3px solid rgba(16, 185, 129, 0.2); border-top-color: var(--emerald-light); border-radius: 50%; will-change: transform; }
         
         @media (max-width: 768px) { .chart-container { height: 280px; } .stats-row { grid-template-columns: 1fr; } }
-    </style>
-<base target="_blank">
-</head>
-<body>
-    <header class="mission-header">
-        <div class="container">
-            <div class="row align-items-center">
-                <div class="col-md-6">
-                    <div class="d-flex align-items-center gap-3">
-                        <i class="fas fa-leaf text-success fs-3"></i>
-                        <div>
-                            <h1 class="project-title mb-0">Plant AI Monitor</h1>
-                            <span class="team-badge">Intelligent Sprayer System Pro</span>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-6 text-md-end mt-3 mt-md-0">
-                    <div class="status-indicator justify-content-md-end" id="connectionStatus">
-                        <span id="statusDot" class="status-dot online"></span>
-                        <span id="statusText">System Online</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </header>
+        
+        /* Decorative loops stop when the tab is in the background or the user asked for less motion */
+        body.tab-hidden *, body.tab-hidden *::before, body.tab-hidden *::after { animation-play-state: paused !important; }
+        @media (prefers-reduced-motion: reduce) { *, *::before, *::after { animation-iteration-count: 1 !important; animation-duration: 0.01ms !important; transition-duration: 0.01ms !important; } }
+"""
 
-    <main class="container py-4">
-        <!-- KPI Cards -->
-        <div class="row g-3 mb-4">
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card" id="plantCard" onclick="openOverlay('plant')">
-                    <div class="kpi-icon healthy" id="plantIcon"><i class="fas fa-seedling"></i></div>
-                    <div class="kpi-label">Plant Status</div>
-                    <div class="kpi-value healthy" id="plantStatus">--</div>
-                    <div class="kpi-subtext" id="plantSubtext">Waiting for data...</div>
-                </div>
-            </div>
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card info" onclick="openOverlay('confidence')">
-                    <div class="kpi-icon moisture"><i class="fas fa-brain"></i></div>
-                    <div class="kpi-label">AI Confidence</div>
-                    <div class="kpi-value info" id="confidenceValue">--%</div>
-                    <div class="kpi-subtext">Neural Network</div>
-                </div>
-            </div>
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card" id="moistureCard" onclick="openOverlay('moisture')">
-                    <div class="kpi-icon moisture"><i class="fas fa-tint"></i></div>
-                    <div class="kpi-label">Soil Moisture</div>
-                    <div class="kpi-value info" id="moistureValue">--%</div>
-                    <div class="kpi-subtext" id="moistureStatus">Waiting...</div>
-                </div>
-            </div>
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card" onclick="openOverlay('temperature')">
-                    <div class="kpi-icon temperature"><i class="fas fa-thermometer-half"></i></div>
-                    <div class="kpi-label">Temperature</div>
-                    <div class="kpi-value warning" id="tempValue">--°C</div>
-                    <div class="kpi-subtext">Ambient</div>
-                </div>
-            </div>
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card info" onclick="openOverlay('humidity')">
-                    <div class="kpi-icon humidity"><i class="fas fa-water"></i></div>
-                    <div class="kpi-label">Humidity</div>
-                    <div class="kpi-value info" id="humidityValue">--%</div>
-                    <div class="kpi-subtext">Air Moisture</div>
-                </div>
-            </div>
-            <div class="col-6 col-md-4 col-lg-2">
-                <div class="kpi-card" id="motorCard" onclick="openOverlay('motor')">
-                    <div class="kpi-icon pump" id="motorIconContainer"><i class="fas fa-cog" id="motorIcon"></i></div>
-                    <div class="kpi-label">Motor Status</div>
-                    <div class="kpi-value" id="motorStatus">IDLE</div>
-                    <div class="kpi-subtext" id="motorSubtext">Ready</div>
-                </div>
-            </div>
-        </div>
+DASHBOARD_JS = """
+        // ===================== REAL DATA CONFIGURATION =====================
+        const API_BASE = ''; // Same origin
+        
+        // Severity class mapping from Python code
+        const SEVERITY_CLASSES = ['healthy', 'high', 'low', 'medium'];
+        const SPRAY_RUN_TIMES = { low: 2, medium: 3, high: 5 };
+        
+        // ===================== STATE VARIABLES =====================
+        let isSpraying = false;
+        let motorSpinning = false;
+        let isConnected = false;
+        // Points are kept in Chart.js's internal {x: label index, y} form so it can skip parsing
+        let moistureHistory = Array.from({ length: 30 }, (_, i) => ({ x: i, y: 50 }));
+        let lastMoisture = 50;
+        // Sensor noise moves the reading by a tenth or two; smaller steps than
+        // this don't add a chart point, so the chart isn't redrawn every tick
+        const MOISTURE_CHART_STEP = 0.5;
+        
+        // Current data from backend
+        const currentData = {
+            plant: 'Waiting...',
+            plantLabel: 'waiting...',
+            confidence: 0,
+            moisture: 0,
+            temperature: null,
+            humidity: null,
+            motor: 'OFF',
+            severity: 0,
+            detections: 0,
+            moistureAvg: 0,
+            moistureMin: 0,
+            tempAvg: 0,
+            tempMax: 0,
+            humidityAvg: 0,
+            humidityTrend: 'Stable',
+            sprayCount: 0,
+            lastSpray: 'Never',
+            history: [],
+            sprayHistory: []
+        };
 
-        <!-- FORCE SPRAY SECTION -->
-        <div class="force-spray-section">
-            <div class="row align-items-center">
-                <div class="col-md-8">
-                    <div class="d-flex align-items-center gap-3">
-                        <div class="kpi-icon infected" style="margin-bottom: 0;"><i class="fas fa-exclamation-triangle"></i></div>
-                        <div>
-                            <h5 class="mb-1" style="color: var(--alert-red); text-shadow: 0 0 10px rgba(255, 59, 92, 0.3);"><i class="fas fa-spray-can me-2"></i>Manual Override Control</h5>
-                            <p class="mb-0 text-muted small">Emergency spray activation - Triggers 3-second spray regardless of conditions</p>
-                        </div>
-                    </div>
-                </div>
-                <div class="col-md-4 mt-3 mt-md-0">
-                    <button class="force-spray-btn" id="forceSprayBtn" onclick="forceSpray()">
-                        <i class="fas fa-exclamation-triangle"></i><span>FORCE SPRAY</span>
-                    </button>
-                </div>
-            </div>
-        </div>
-
-        <!-- LIVE CAMERA & AUTO-SPRAY DURATION ROW -->
-        <div class="row g-4 mb-4">
-            <div class="col-lg-8">
-                <div class="operation-panel">
-                    <div class="panel-header">
-                        <i class="fas fa-video"></i>
-                        <h5>Live Camera Feed (HD 720p)</h5>
-                        <span class="badge bg-danger ms-auto animate-pulse">LIVE</span>
-                    </div>
-                    <div class="p-3">
-                        <div class="live-feed-container" id="liveFeedContainer">
-                            <img id="videoFeed" src="/video_feed" class="w-100 h-100 object-fit-cover" alt="Live Feed" style="min-height: 300px;">
-                            <span class="live-badge">LIVE</span>
-                            <div class="detection-overlay" id="detectionOverlay">
-                                <div class="detection-status" id="detectionStatus"><i class="fas fa-search"></i><span>Analyzing...</span></div>
-                                <span class="confidence-score" id="confidenceScore">--</span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            <div class="col-lg-4">
-                <div class="spray-duration-panel">
-                    <div class="d-flex align-items-center gap-2 mb-3">
-                        <i class="fas fa-clock" style="color: var(--emerald-primary);"></i>
-                        <h6 class="mb-0" style="color: var(--text-primary); font-weight: 700; text-transform: uppercase; letter-spacing: 1px;">Auto-Spray Durations</h6>
-                    </div>
-                    <p class="text-muted small mb-3">Automatic spray duration based on detected severity level</p>
-                    <div class="duration-item low">
-                        <div class="d-flex align-items-center gap-2"><span class="duration-badge low">LOW</span><span class="text-muted small">Mild Detection</span></div>
-                        <span class="duration-time" style="color: var(--warning-amber);">2s</span>
-                    </div>
-                    <div class="duration-item medium">
-                        <div class="d-flex align-items-center gap-2"><span class="duration-badge medium">MED</span><span class="text-muted small">Moderate Detection</span></div>
-                        <span class="duration-time" style="color: #f97316;">3s</span>
-                    </div>
-                    <div class="duration-item high">
-                        <div class="d-flex align-items-center gap-2"><span class="duration-badge high">HIGH</span><span class="text-muted small">Severe Detection</span></div>
-                        <span class="duration-time" style="color: var(--alert-red);">5s</span>
-                    </div>
-                    <div class="mt-3 p-2 rounded" style="background: rgba(0, 245, 160, 0.05); border: 1px solid rgba(0, 245, 160, 0.1);">
-                        <small class="text-muted" style="font-size: 0.75rem;"><i class="fas fa-info-circle me-1" style="color: var(--emerald-primary);"></i>System automatically adjusts spray duration based on AI analysis confidence</small>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- CENTER CHART SECTION -->
-        <div class="row mb-4">
-            <div class="col-12">
-                <div class="chart-container">
-                    <div class="d-flex align-items-center justify-content-between mb-3">
-                        <h5 class="mb-0" style="color: var(--text-primary); font-weight: 700;"><i class="fas fa-chart-area me-2" style="color: var(--emerald-primary);"></i>Soil Moisture History Analysis</h5>
-                        <div class="d-flex gap-2">
-                            <span class="badge" style="background: rgba(0, 245, 160, 0.2); color: var(--emerald-primary);"><i class="fas fa-circle me-1" style="font-size: 0.5rem;"></i>Live Data</span>
-                            <span class="text-muted small">Last 30 readings</span>
-                        </div>
-                    </div>
-                    <canvas id="moistureChart"></canvas>
-                </div>
-            </div>
-        </div>
-
-        <!-- ACTIVITY LOG SECTION -->
-        <div class="row">
-            <div class="col-12">
-                <div class="activity-log">
-                    <div class="log-header">
-                        <i class="fas fa-terminal"></i>
-                        <h6>System Activity Log</h6>
-                        <span class="badge bg-secondary ms-auto" id="logCount">0</span>
-                    </div>
-                    <div class="log-entries" id="logEntries">
-                        <div class="text-center text-muted py-4"><i class="fas fa-circle-notch fa-spin mb-2"></i><p class="small mb-0">Loading logs...</p></div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <div class="toast-container" id="toastContainer"></div>
-
-    <div class="tech-overlay-backdrop" id="techOverlay" onclick="closeOverlay(event)">
-        <div class="tech-info-overlay" id="overlayContent" onclick="event.stopPropagation()">
-            <div class="tech-corner tech-corner-tl"></div><div class="tech-corner tech-corner-tr"></div>
-            <div class="tech-corner tech-corner-bl"></div><div class="tech-corner tech-corner-br"></div>
-            <div class="tech-overlay-header">
-                <div class="tech-overlay-icon" id="overlayIcon"><i class="fas fa-leaf"></i></div>
-                <div class="tech-overlay-title-group">
-                    <div class="tech-overlay-title" id="overlayTitle">Sensor Details</div>
-                    <div class="tech-overlay-subtitle" id="overlaySubtitle">Technical Diagnostics</div>
-                </div>
-                <button class="tech-overlay-close" onclick="closeOverlay()"><i class="fas fa-times"></i></button>
-            </div>
-            <div class="tech-overlay-content" id="overlayContentArea"></div>
-            <div class="tech-data-grid" id="overlayDataGrid">
-                <div class="tech-data-item"><div class="tech-data-label">Last Reading</div><div class="tech-data-value" id="dataReading">--</div></div>
-                <div class="tech-data-item"><div class="tech-data-label">Sensor ID</div><div class="tech-data-value" id="dataSensor">--</div></div>
-                <div class="tech-data-item"><div class="tech-data-label">Accuracy</div><div class="tech-data-value" id="dataAccuracy">--</div></div>
-                <div class="tech-data-item"><div class="tech-data-label">Uptime</div><div class="tech-data-value" id="dataUptime">--</div></div>
-            </div>
-            <div class="tech-overlay-footer">
-                <span class="tech-status-badge" id="overlayStatus">Operational</span>
-                <span class="tech-timestamp" id="overlayTimestamp">--</span>
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // ===================== REAL DATA CONFIGURATION =====================
-        const API_BASE = ''; // Same origin
-        
-        // Severity class mapping from Python code
-        const SEVERITY_CLASSES = ['healthy', 'high', 'low', 'medium'];
-        const SPRAY_RUN_TIMES = { low: 2, medium: 3, high: 5 };
-        
-        // ===================== STATE VARIABLES =====================
-        let isSpraying = false;
-        let lastFetchTime = Date.now();
-        let isConnected = false;
-        let moistureHistory = Array(30).fill(50);
-        let lastMoisture = 50;
-        
-        // Current data from backend
-        let currentData = {
-            plant: 'Waiting...',
-            confidence: 0,
-            moisture: 0,
-            temperature: null,
-            humidity: null,
-            motor: 'OFF',
-            severity: 0,
-            detections: 0,
-            moistureAvg: 0,
-            moistureMin: 0,
-            tempAvg: 0,
-            tempMax: 0,
-            humidityAvg: 0,
-            humidityTrend: 'Stable',
-            sprayCount: 0,
-            lastSpray: 'Never',
-            history: [],
-            sprayHistory: []
-        };
-
-        // ===================== OVERLAY CONFIGURATION =====================
-        const overlayConfig = {
-            plant: { 
-                title: 'Plant Health Analysis', 
-                subtitle: 'AI-Powered Disease Detection', 
-                icon: 'fa-seedling', 
-                status: 'Analyzing', 
-                class: '', 
-                sensorId: 'CAM-001-AI', 
-                accuracy: '+-2.5%', 
-                uptime: '99.8%', 
-                renderContent: (data) => {
-                    const plantLabel = (data.plant || '').split(' ')[0].toLowerCase();
-                    const isHealthy = plantLabel === 'healthy';
-                    const severity = isHealthy ? 0 : (data.confidence || 0);
-                    return `
-                    <div class="stats-row">
-                        <div class="stat-box"><div class="stat-value" style="color: ${isHealthy ? 'var(--emerald-primary)' : 'var(--alert-red)'}">${isHealthy ? '100%' : severity.toFixed(1) + '%'}</div><div class="stat-label">Health Score</div></div>
-                        <div class="stat-box"><div class="stat-value" style="color: var(--info-blue)">${data.confidence?.toFixed(1) || '0.0'}%</div><div class="stat-label">AI Confidence</div></div>
-                        <div class="stat-box"><div class="stat-value" style="color: var(--warning-amber)">${data.detections || 0}</div><div class="stat-label">Detections</div></div>
+        // ===================== OVERLAY CONFIGURATION =====================
+        const overlayConfig = {
+            plant: { 
+                title: 'Plant Health Analysis', 
+                subtitle: 'AI-Powered Disease Detection', 
+                icon: 'fa-seedling', 
+                status: 'Analyzing', 
+                class: '', 
+                sensorId: 'CAM-001-AI', 
+                accuracy: '+-2.5%', 
+                uptime: '99.8%', 
+                renderContent: (data) => {
+                    const plantLabel = data.plantLabel;
+                    const isHealthy = plantLabel === 'healthy';
+                    const severity = isHealthy ? 0 : (data.confidence || 0);
+                    return `
+                    <div class="stats-row">
+                        <div class="stat-box"><div class="stat-value" style="color: ${isHealthy ? 'var(--emerald-primary)' : 'var(--alert-red)'}">${isHealthy ? '100%' : severity.toFixed(1) + '%'}</div><div class="stat-label">Health Score</div></div>
+                        <div class="stat-box"><div class="stat-value" style="color: var(--info-blue)">${data.confidence?.toFixed(1) || '0.0'}%</div><div class="stat-label">AI Confidence</div></div>
+                        <div class="stat-box"><div class="stat-value" style="color: var(--warning-amber)">${data.detections || 0}</div><div class="stat-label">Detections</div></div>
                     </div>
                     <div class="tech-progress-container">
                         <div class="tech-progress-label"><span>Disease Severity</span><span>${severity.toFixed(1)}%</span></div>
                         <div class="tech-progress-bar"><div class="tech-progress-fill ${severity > 50 ? 'danger' : severity > 25 ? 'warning' : 'success'}" style="width: ${severity}%"></div></div>
                     </div>
-                    <div style="background: ${isHealthy ? 'rgba(0,245,160,0.08)' : 'rgba(255,59,92,0.08)'}; padding: 1rem; border-radius: 10px; border: 1px solid ${isHealthy ? 'rgba(0,245,160,0.2)' : 'rgba(255,59,92,0.2)'}">
-                        <h6 style="color: ${isHealthy ? 'var(--emerald-primary)' : 'var(--alert-red)'}; margin-bottom: 0.75rem;"><i class="fas ${isHealthy ? 'fa-check-circle' : 'fa-exclamation-triangle'} me-2"></i>Diagnosis</h6>
-                        <p style="color: var(--text-secondary); font-size: 0.9rem; margin: 0;">${isHealthy ? 'Plant appears healthy with no signs of disease. Continue regular monitoring and maintenance.' : `Detected <strong style="color: var(--alert-red)">${data.plant || 'Unknown Condition'}</strong>. Immediate treatment recommended.`}</p>
+                    <div class="overlay-panel ${isHealthy ? 'healthy' : 'alert'}">
+                        <h6><i class="fas ${isHealthy ? 'fa-check-circle' : 'fa-exclamation-triangle'} me-2"></i>Diagnosis</h6>
+                        <p>${isHealthy ? 'Plant appears healthy with no signs of disease. Continue regular monitoring and maintenance.' : `Detected <strong style="color: var(--alert-red)">${data.plant || 'Unknown Condition'}</strong>. Immediate treatment recommended.`}</p>
                     </div>`;
                 }
             },
@@ -916,13 +1214,13 @@ def dashboard():
                         <div class="tech-progress-label"><span>Model Confidence</span><span>${data.confidence?.toFixed(1) || '0.0'}%</span></div>
                         <div class="tech-progress-bar"><div class="tech-progress-fill ${data.confidence > 75 ? 'success' : data.confidence > 45 ? 'warning' : 'danger'}" style="width: ${data.confidence || 0}%"></div></div>
                     </div>
-                    <div style="background: rgba(61,169,255,0.08); padding: 1rem; border-radius: 10px; border: 1px solid rgba(61,169,255,0.2)">
-                        <h6 style="color: var(--info-blue); margin-bottom: 0.75rem;"><i class="fas fa-microchip me-2"></i>Model Information</h6>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; font-size: 0.85rem;">
-                            <div><span style="color: var(--text-muted)">Architecture:</span> <span style="color: var(--text-primary)">MobileNetV2</span></div>
-                            <div><span style="color: var(--text-muted)">Binary Threshold:</span> <span style="color: var(--text-primary)">0.6</span></div>
-                            <div><span style="color: var(--text-muted)">Conf Threshold:</span> <span style="color: var(--text-primary)">45%</span></div>
-                            <div><span style="color: var(--text-muted)">Device:</span> <span style="color: var(--text-primary)">${navigator.gpu ? 'GPU' : 'CPU'}</span></div>
+                    <div class="overlay-panel info">
+                        <h6><i class="fas fa-microchip me-2"></i>Model Information</h6>
+                        <div class="overlay-params">
+                            <div><span>Architecture:</span> <span>MobileNetV2</span></div>
+                            <div><span>Binary Threshold:</span> <span>0.6</span></div>
+                            <div><span>Conf Threshold:</span> <span>45%</span></div>
+                            <div><span>Device:</span> <span>${navigator.gpu ? 'GPU' : 'CPU'}</span></div>
                         </div>
                     </div>`
             },
@@ -954,9 +1252,9 @@ def dashboard():
                         <div style="text-align: center; padding: 0.75rem; background: rgba(255,176,32,0.1); border-radius: 8px; border: 1px solid rgba(255,176,32,0.2)"><div style="font-size: 0.7rem; color: var(--warning-amber); text-transform: uppercase;">Warning</div><div style="font-weight: 700; color: var(--text-primary);">30-40%</div></div>
                         <div style="text-align: center; padding: 0.75rem; background: rgba(0,245,160,0.1); border-radius: 8px; border: 1px solid rgba(0,245,160,0.2)"><div style="font-size: 0.7rem; color: var(--emerald-primary); text-transform: uppercase;">Optimal</div><div style="font-weight: 700; color: var(--text-primary);">40-70%</div></div>
                     </div>
-                    <div style="background: ${moisture < 40 ? 'rgba(255,59,92,0.08)' : 'rgba(0,245,160,0.08)'}; padding: 1rem; border-radius: 10px; border: 1px solid ${moisture < 40 ? 'rgba(255,59,92,0.2)' : 'rgba(0,245,160,0.2)'}">
-                        <h6 style="color: ${moisture < 40 ? 'var(--alert-red)' : 'var(--emerald-primary)'}; margin-bottom: 0.5rem;"><i class="fas fa-info-circle me-2"></i>Recommendation</h6>
-                        <p style="color: var(--text-secondary); font-size: 0.9rem; margin: 0;">${moisture < 30 ? 'Soil moisture is critically low. Auto-spray will trigger if plant detected.' : moisture < 40 ? 'Moisture levels are below optimal. Consider irrigation.' : moisture > 70 ? 'Soil is very wet. Ensure proper drainage.' : 'Moisture levels are optimal. Continue current schedule.'}</p>
+                    <div class="overlay-panel ${moisture < 40 ? 'alert' : 'healthy'}">
+                        <h6><i class="fas fa-info-circle me-2"></i>Recommendation</h6>
+                        <p>${moisture < 30 ? 'Soil moisture is critically low. Auto-spray will trigger if plant detected.' : moisture < 40 ? 'Moisture levels are below optimal. Consider irrigation.' : moisture > 70 ? 'Soil is very wet. Ensure proper drainage.' : 'Moisture levels are optimal. Continue current schedule.'}</p>
                     </div>`;
                 }
             },
@@ -986,9 +1284,9 @@ def dashboard():
                         <div style="text-align: center; padding: 0.5rem; background: rgba(255,59,92,0.1); border-radius: 6px;"><div style="font-size: 0.65rem; color: var(--alert-red);">Hot</div><div style="font-size: 0.8rem; font-weight: 600;">30-35°C</div></div>
                         <div style="text-align: center; padding: 0.5rem; background: rgba(139,92,246,0.1); border-radius: 6px;"><div style="font-size: 0.65rem; color: var(--automation-violet);">Critical</div><div style="font-size: 0.8rem; font-weight: 600;">&gt;35°C</div></div>
                     </div>
-                    <div style="background: ${status === 'danger' ? 'rgba(255,59,92,0.08)' : 'rgba(0,245,160,0.08)'}; padding: 1rem; border-radius: 10px; border: 1px solid ${status === 'danger' ? 'rgba(255,59,92,0.2)' : 'rgba(0,245,160,0.2)'}">
-                        <h6 style="color: ${status === 'danger' ? 'var(--alert-red)' : 'var(--emerald-primary)'}; margin-bottom: 0.5rem;"><i class="fas ${status === 'danger' ? 'fa-exclamation-triangle' : 'fa-check-circle'} me-2"></i>${status === 'danger' ? 'High Temperature Alert' : 'Temperature Status'}</h6>
-                        <p style="color: var(--text-secondary); font-size: 0.9rem; margin: 0;">${!hasData ? 'Waiting for sensor data...' : status === 'danger' ? 'Temperature is above optimal range. Consider increasing ventilation.' : status === 'warning' ? 'Temperature is slightly elevated. Monitor closely.' : 'Temperature is within optimal growing range.'}</p>
+                    <div class="overlay-panel ${status === 'danger' ? 'alert' : 'healthy'}">
+                        <h6><i class="fas ${status === 'danger' ? 'fa-exclamation-triangle' : 'fa-check-circle'} me-2"></i>${status === 'danger' ? 'High Temperature Alert' : 'Temperature Status'}</h6>
+                        <p>${!hasData ? 'Waiting for sensor data...' : status === 'danger' ? 'Temperature is above optimal range. Consider increasing ventilation.' : status === 'warning' ? 'Temperature is slightly elevated. Monitor closely.' : 'Temperature is within optimal growing range.'}</p>
                     </div>`;
                 }
             },
@@ -1017,9 +1315,9 @@ def dashboard():
                         <div style="text-align: center; padding: 0.75rem; background: rgba(0,245,160,0.1); border-radius: 8px;"><div style="font-size: 0.7rem; color: var(--emerald-primary); text-transform: uppercase;">Optimal</div><div style="font-weight: 700;">40-70%</div></div>
                         <div style="text-align: center; padding: 0.75rem; background: rgba(255,59,92,0.1); border-radius: 8px;"><div style="font-size: 0.7rem; color: var(--alert-red); text-transform: uppercase;">High</div><div style="font-weight: 700;">&gt;70%</div></div>
                     </div>
-                    <div style="background: rgba(6,182,212,0.08); padding: 1rem; border-radius: 10px; border: 1px solid rgba(6,182,212,0.2)">
-                        <h6 style="color: #22d3ee; margin-bottom: 0.5rem;"><i class="fas fa-cloud me-2"></i>Humidity Impact</h6>
-                        <p style="color: var(--text-secondary); font-size: 0.9rem; margin: 0;">${!hasData ? 'Waiting for sensor data...' : humidity < 40 ? 'Low humidity may cause plant stress. Consider misting.' : humidity > 70 ? 'High humidity increases disease risk. Auto-spray disabled above 70%.' : 'Humidity levels are ideal for most plant growth.'}</p>
+                    <div class="overlay-panel cyan">
+                        <h6><i class="fas fa-cloud me-2"></i>Humidity Impact</h6>
+                        <p>${!hasData ? 'Waiting for sensor data...' : humidity < 40 ? 'Low humidity may cause plant stress. Consider misting.' : humidity > 70 ? 'High humidity increases disease risk. Auto-spray disabled above 70%.' : 'Humidity levels are ideal for most plant growth.'}</p>
                     </div>`;
                 }
             },
@@ -1043,131 +1341,281 @@ def dashboard():
                         <button class="btn btn-success" onclick="forceSpray(); closeOverlay();" style="background: var(--gradient-primary); border: none; padding: 0.75rem; font-weight: 600;"><i class="fas fa-play me-2"></i>Start Spray</button>
                         <button class="btn btn-outline-secondary" onclick="showToast('Calibration mode not implemented', 'info');" style="border-color: var(--border-color); color: var(--text-secondary);"><i class="fas fa-wrench me-2"></i>Calibrate</button>
                     </div>
-                    <div style="background: rgba(139,92,246,0.08); padding: 1rem; border-radius: 10px; border: 1px solid rgba(139,92,246,0.2)">
-                        <h6 style="color: var(--automation-violet); margin-bottom: 0.75rem;"><i class="fas fa-cogs me-2"></i>System Parameters</h6>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.75rem; font-size: 0.85rem;">
-                            <div><span style="color: var(--text-muted)">Flow Rate:</span> <span style="color: var(--text-primary)">2.5 L/min</span></div>
-                            <div><span style="color: var(--text-muted)">Pressure:</span> <span style="color: var(--text-primary)">3.2 bar</span></div>
-                            <div><span style="color: var(--text-muted)">Nozzle Type:</span> <span style="color: var(--text-primary)">Fan Spray</span></div>
-                            <div><span style="color: var(--text-muted)">Tank Level:</span> <span style="color: var(--text-primary)">~78%</span></div>
+                    <div class="overlay-panel violet">
+                        <h6><i class="fas fa-cogs me-2"></i>System Parameters</h6>
+                        <div class="overlay-params">
+                            <div><span>Flow Rate:</span> <span>2.5 L/min</span></div>
+                            <div><span>Pressure:</span> <span>3.2 bar</span></div>
+                            <div><span>Nozzle Type:</span> <span>Fan Spray</span></div>
+                            <div><span>Tank Level:</span> <span>~78%</span></div>
                         </div>
                     </div>
                     <div style="margin-top: 1rem;">
                         <h6 style="color: var(--text-muted); font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 0.5rem;"><i class="fas fa-history me-1"></i>Spray History</h6>
-                        <div style="max-height: 120px; overflow-y: auto;">${(data.sprayHistory || []).length > 0 ? data.sprayHistory.map(h => `<div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid var(--border-color); font-size: 0.8rem;"><span style="color: var(--text-secondary)">${h.time}</span><span style="color: ${h.trigger === 'Manual' ? 'var(--warning-amber)' : 'var(--emerald-primary)'}">${h.trigger} (${h.duration}s)</span></div>`).join('') : '<div style="color: var(--text-muted); font-size: 0.8rem; text-align: center; padding: 0.5rem;">No sprays recorded yet</div>'}</div>
+                        <div style="max-height: 120px; overflow-y: auto;">${(data.sprayHistory || []).length > 0 ? data.sprayHistory.map(h => `<div class="spray-history-row"><span>${h.time}</span><span class="${h.trigger === 'Manual' ? 'manual' : 'auto'}">${h.trigger} (${h.duration}s)</span></div>`).join('') : '<div style="color: var(--text-muted); font-size: 0.8rem; text-align: center; padding: 0.5rem;">No sprays recorded yet</div>'}</div>
                     </div>`
             }
         };
 
         // ===================== CHART SETUP =====================
-        const ctx = document.getElementById('moistureChart').getContext('2d');
-        const moistureChart = new Chart(ctx, {
-            type: 'line',
-            data: { 
-                labels: Array(30).fill('').map((_, i) => `-${30-i}s`), 
-                datasets: [{ 
-                    label: 'Moisture %', 
-                    data: moistureHistory, 
-                    borderColor: '#3b82f6', 
-                    backgroundColor: (context) => {
-                        const ctx = context.chart.ctx;
-                        const gradient = ctx.createLinearGradient(0, 0, 0, 300);
-                        gradient.addColorStop(0, 'rgba(59, 130, 246, 0.3)');
-                        gradient.addColorStop(1, 'rgba(59, 130, 246, 0.05)');
-                        return gradient;
-                    },
-                    fill: true, 
-                    tension: 0.4, 
-                    pointRadius: 4, 
-                    pointBackgroundColor: '#3b82f6', 
-                    pointBorderColor: '#fff', 
-                    pointBorderWidth: 2, 
-                    borderWidth: 3 
-                }] 
-            },
-            options: { 
-                responsive: true, 
-                maintainAspectRatio: false, 
-                plugins: { 
-                    legend: { display: false }, 
-                    tooltip: { 
-                        backgroundColor: 'rgba(15, 23, 36, 0.95)', 
-                        titleColor: '#00f5a0', 
-                        bodyColor: '#e6edf6', 
-                        borderColor: 'rgba(0, 245, 160, 0.3)', 
-                        borderWidth: 1, 
-                        padding: 12, 
-                        displayColors: false 
-                    } 
-                }, 
-                scales: { 
-                    x: { 
-                        display: true, 
-                        grid: { color: 'rgba(255, 255, 255, 0.03)' }, 
-                        ticks: { color: '#6b8098', font: { size: 9 }, maxTicksLimit: 6 } 
+        // Chart settings, shared by the chart worker and the main-thread
+        // fallback; the worker gets this function's source
+        function moistureChartConfig(history) {
+            // y ticks are whole percents; their labels are built once, not on every redraw
+            const percentLabels = Array.from({ length: 101 }, (_, i) => `${i}%`);
+            let fillGradient = null;
+            return {
+                type: 'line',
+                data: { 
+                    labels: Array.from({ length: 30 }, (_, i) => `-${30 - i}s`), 
+                    datasets: [{ 
+                        label: 'Moisture %', 
+                        data: history, 
+                        borderColor: '#3b82f6', 
+                        backgroundColor: (context) => {
+                            // Spans a fixed 300px, so one gradient serves every redraw
+                            if (!fillGradient) {
+                                fillGradient = context.chart.ctx.createLinearGradient(0, 0, 0, 300);
+                                fillGradient.addColorStop(0, 'rgba(59, 130, 246, 0.3)');
+                                fillGradient.addColorStop(1, 'rgba(59, 130, 246, 0.05)');
+                            }
+                            return fillGradient;
+                        },
+                        fill: true, 
+                        tension: 0.4, 
+                        pointRadius: 0, 
+                        pointHoverRadius: 4, 
+                        pointHitRadius: 10, 
+                        pointBackgroundColor: '#3b82f6', 
+                        pointBorderColor: '#fff', 
+                        pointBorderWidth: 2, 
+                        borderWidth: 3 
+                    }] 
+                },
+                options: { 
+                    responsive: true, 
+                    maintainAspectRatio: false, 
+                    parsing: false, 
+                    normalized: true, 
+                    plugins: { 
+                        legend: { display: false }, 
+                        tooltip: { 
+                            backgroundColor: 'rgba(15, 23, 36, 0.95)', 
+                            titleColor: '#00f5a0', 
+                            bodyColor: '#e6edf6', 
+                            borderColor: 'rgba(0, 245, 160, 0.3)', 
+                            borderWidth: 1, 
+                            padding: 12, 
+                            displayColors: false 
+                        } 
                     }, 
-                    y: { 
-                        min: 0, 
-                        max: 100, 
-                        grid: { color: 'rgba(255, 255, 255, 0.05)' }, 
-                        ticks: { 
-                            color: '#94a3b8', 
-                            font: { size: 11 }, 
-                            callback: function(value) { return value + '%'; } 
+                    scales: { 
+                        x: { 
+                            display: true, 
+                            grid: { color: 'rgba(255, 255, 255, 0.03)' }, 
+                            ticks: { color: '#6b8098', font: { size: 9 }, maxTicksLimit: 6 } 
+                        }, 
+                        y: { 
+                            min: 0, 
+                            max: 100, 
+                            grid: { color: 'rgba(255, 255, 255, 0.05)' }, 
+                            ticks: { 
+                                color: '#94a3b8', 
+                                font: { size: 11 }, 
+                                callback: (value) => percentLabels[value] ?? value + '%' 
+                            } 
                         } 
-                    } 
-                }, 
-                animation: { duration: 300 } 
+                    }, 
+                    animation: false 
+                }
+            };
+        }
+
+        // Slides the values along in place - no new arrays or points per update.
+        // Not a ring buffer: Chart.js draws points in array order, so a ring
+        // would have to be unrolled into order on every update anyway.
+        function shiftHistory(history, value) {
+            for (let i = 0; i < history.length - 1; i++) history[i].y = history[i + 1].y;
+            history[history.length - 1].y = value;
+        }
+
+        // Where OffscreenCanvas is supported, Chart.js draws the chart in a
+        // worker, so its redraws never hold up the video feed or the page.
+        // Workers get no layout or DOM events, so the canvas size and the
+        // pointer (for the tooltip) are passed over from here.
+        const CHART_WORKER_SOURCE = `
+            importScripts('https://cdn.jsdelivr.net/npm/chart.js');
+            ${moistureChartConfig}
+            ${shiftHistory}
+            let chart, history;
+            
+            // Samples and pointer moves can arrive faster than the display
+            // refreshes; the chart is redrawn at most once per frame
+            const nextFrame = self.requestAnimationFrame ? self.requestAnimationFrame.bind(self) : (callback => setTimeout(callback, 16));
+            let drawPending = false;
+            function scheduleDraw() {
+                if (drawPending) return;
+                drawPending = true;
+                nextFrame(() => {
+                    drawPending = false;
+                    chart.update('none');
+                });
             }
-        });
+            
+            self.onmessage = ({ data }) => {
+                if (data.type === 'init') {
+                    history = data.history;
+                    const config = moistureChartConfig(history);
+                    config.options.responsive = false;
+                    config.options.devicePixelRatio = data.pixelRatio;
+                    chart = new Chart(data.canvas, config);
+                } else if (data.type === 'resize') {
+                    chart.resize(data.width, data.height);
+                } else if (data.type === 'moisture') {
+                    shiftHistory(history, data.value);
+                    scheduleDraw();
+                } else if (data.type === 'pointer') {
+                    const active = data.x === null ? [] : chart.getElementsAtEventForMode(
+                        { type: 'mousemove', native: null, x: data.x, y: data.y }, 'nearest', { intersect: true }, false);
+                    chart.setActiveElements(active);
+                    chart.tooltip.setActiveElements(active, { x: data.x, y: data.y });
+                    scheduleDraw();
+                }
+            };
+        `;
+
+        // Chart.js is loaded with defer, so the chart is built once it has arrived
+        let moistureChart;
+        let chartWorker = null;
+
+        function initChart() {
+            const canvas = document.getElementById('moistureChart');
+            if (!canvas.transferControlToOffscreen || typeof Worker === 'undefined') {
+                moistureChart = new Chart(canvas.getContext('2d'), moistureChartConfig(moistureHistory));
+                return;
+            }
+            
+            chartWorker = new Worker(URL.createObjectURL(new Blob([CHART_WORKER_SOURCE], { type: 'text/javascript' })));
+            const offscreen = canvas.transferControlToOffscreen();
+            chartWorker.postMessage({ type: 'init', canvas: offscreen, history: moistureHistory, pixelRatio: window.devicePixelRatio }, [offscreen]);
+            
+            // Sized the way Chart.js's responsive mode does: the container's content box
+            const container = canvas.parentNode;
+            new ResizeObserver(() => {
+                const style = getComputedStyle(container);
+                const width = container.clientWidth - parseFloat(style.paddingLeft) - parseFloat(style.paddingRight);
+                const height = container.clientHeight - parseFloat(style.paddingTop) - parseFloat(style.paddingBottom);
+                canvas.style.width = `${width}px`;
+                canvas.style.height = `${height}px`;
+                chartWorker.postMessage({ type: 'resize', width, height });
+            }).observe(container);
+            
+            canvas.addEventListener('mousemove', e => chartWorker.postMessage({ type: 'pointer', x: e.offsetX, y: e.offsetY }));
+            canvas.addEventListener('mouseleave', () => chartWorker.postMessage({ type: 'pointer', x: null, y: null }));
+        }
+
+        function pushMoisture(value) {
+            if (chartWorker) {
+                chartWorker.postMessage({ type: 'moisture', value });
+            } else {
+                shiftHistory(moistureHistory, value);
+                moistureChart.update('none');
+            }
+        }
 
         // ===================== API FUNCTIONS =====================
-        async function fetchStatus() {
-            try {
-                const response = await fetch('/status');
-                if (!response.ok) throw new Error('Status API error');
-                const data = await response.json();
-                
-                // Update connection status
-                isConnected = true;
-                lastFetchTime = Date.now();
-                updateConnectionStatus(true);
-                
-                // Update current data
-                currentData = {
-                    ...currentData,
-                    plant: data.plant || 'No Plant',
-                    confidence: data.confidence || 0,
-                    moisture: data.moisture || 0,
-                    temperature: data.temperature,
-                    humidity: data.humidity,
-                    motor: data.motor || 'OFF'
-                };
-                
-                // Update UI
+        // Status can arrive more than once between paints - only the latest is
+        // drawn, in one animation frame, so the DOM writes and the chart update
+        // land together instead of mid-frame
+        let uiFrame = 0;
+        function scheduleUI() {
+            if (uiFrame) return;
+            uiFrame = requestAnimationFrame(() => {
+                uiFrame = 0;
+                updateConnectionStatus(isConnected);
                 updateUI(currentData);
-                
-            } catch (error) {
-                console.error('Error fetching status:', error);
+            });
+        }
+
+        function applyStatus(data) {
+            // Update connection status
+            isConnected = true;
+            watchConnection();
+            
+            // Updated in place, so currentData keeps one fixed shape
+            currentData.plant = data.plant || 'No Plant';
+            currentData.plantLabel = currentData.plant.split(' ')[0].toLowerCase();
+            currentData.confidence = data.confidence || 0;
+            currentData.moisture = data.moisture || 0;
+            currentData.temperature = data.temperature ?? null;
+            currentData.humidity = data.humidity ?? null;
+            currentData.motor = data.motor || 'OFF';
+            
+            // Update UI
+            scheduleUI();
+        }
+
+        // ETag of the last /snapshot body applied. The browser answers an
+        // unchanged poll from its cache, so the tag tells us to skip the parse.
+        let lastSnapshotTag = null;
+        let snapshotController = null;
+
+        // Offline is shown once nothing has arrived for this long. Each message
+        // pushes one timer back, rather than a check waking the tab every 2s
+        const OFFLINE_AFTER_MS = 5000;
+        let offlineTimer = 0;
+        function watchConnection() {
+            clearTimeout(offlineTimer);
+            offlineTimer = setTimeout(() => {
                 isConnected = false;
                 updateConnectionStatus(false);
-            }
+            }, OFFLINE_AFTER_MS);
         }
 
-        async function fetchLogs() {
+        // Polls that find nothing new stretch the interval, up to just under the
+        // 5s offline threshold; any change snaps it back to once a second
+        const POLL_MIN_MS = 1000;
+        const POLL_MAX_MS = 4000;
+        let pollMs = POLL_MIN_MS;
+
+        // Polling fallback for browsers without EventSource - status and new
+        // log entries come back together in one request
+        async function fetchSnapshot() {
+            // A poll still waiting on a slow server is dropped, not left to pile up
+            snapshotController?.abort();
+            snapshotController = new AbortController();
             try {
-                const response = await fetch('/logs');
-                if (!response.ok) throw new Error('Logs API error');
-                const logs = await response.json();
+                const response = await fetch(`/snapshot?since=${lastLogId}`, { signal: snapshotController.signal });
+                if (!response.ok) throw new Error('Snapshot API error');
+                const tag = response.headers.get('ETag');
+                if (tag && tag === lastSnapshotTag) {
+                    pollMs = Math.min(POLL_MAX_MS, pollMs * 1.3);
+                    isConnected = true;
+                    watchConnection();
+                    updateConnectionStatus(true);
+                    return;
+                }
+                const { status, logs } = await response.json();
+                lastSnapshotTag = tag;
+                pollMs = POLL_MIN_MS;
+                applyStatus(status);
                 renderLogs(logs);
             } catch (error) {
-                console.error('Error fetching logs:', error);
+                if (error.name === 'AbortError') return;
+                console.error('Error fetching snapshot:', error);
+                isConnected = false;
+                updateConnectionStatus(false);
             }
         }
 
+        // A hung request is abandoned after this long instead of leaving the button waiting
+        const FORCE_SPRAY_TIMEOUT_MS = 2000;
+
         async function sendForceSpray() {
+            const controller = new AbortController();
+            const timer = setTimeout(() => controller.abort(), FORCE_SPRAY_TIMEOUT_MS);
             try {
-                const response = await fetch('/force_spray', { method: 'POST' });
+                const response = await fetch('/force_spray', { method: 'POST', signal: controller.signal });
                 if (!response.ok) throw new Error('Force spray API error');
                 const data = await response.json();
                 showToast('Force spray activated!', 'success');
@@ -1176,202 +1624,266 @@ def dashboard():
                 console.error('Error sending force spray:', error);
                 showToast('Failed to activate spray', 'error');
                 return false;
+            } finally {
+                clearTimeout(timer);
             }
         }
 
         // ===================== UI UPDATE FUNCTIONS =====================
+        // Elements the dashboard writes to - looked up once, not on every update
+        const els = {};
+        ['plantCard', 'plantIcon', 'plantStatus', 'plantSubtext', 'liveFeedContainer', 'detectionOverlay',
+         'detectionStatus', 'confidenceScore', 'confidenceValue', 'moistureValue', 'tempValue', 'humidityValue',
+         'moistureCard', 'moistureStatus', 'motorCard', 'motorStatus', 'motorSubtext',
+         'statusDot', 'statusText', 'connectionStatus', 'logEntries', 'logCount', 'techOverlay',
+         'overlayContent', 'overlayTitle', 'overlaySubtitle', 'overlayIcon', 'overlayStatus', 'dataSensor',
+         'dataAccuracy', 'dataUptime', 'dataReading', 'overlayTimestamp', 'overlayContentArea', 'toastContainer',
+         'forceSprayBtn'
+        ].forEach(id => { els[id] = document.getElementById(id); });
+        let lastPlantLabel = null;
+        let lastMoistureBand = null;
+        const moistureStates = { alert: 'Critical - Low!', warning: 'Warning - Low', optimal: 'Optimal level' };
+        let shownOnline = null;
+
+        // Writes the text only when it changed, so a repeated status doesn't dirty the DOM
+        function setText(el, value) {
+            if (el._v !== value) {
+                el.textContent = value;
+                el._v = value;
+            }
+        }
+
+        // Like setText for a reading: it is only formatted when the number itself
+        // changed, not on every update that happens to repeat it
+        function setNumber(el, value, format) {
+            if (el._n === value) return;
+            el._n = value;
+            setText(el, format(value));
+        }
+        const asPercent = v => v !== null ? `${v.toFixed(1)}%` : '--%';
+        const asCelsius = v => v !== null ? `${v.toFixed(1)}°C` : '--°C';
+        const asConfidence = v => `Confidence: ${v.toFixed(1)}%`;
+
+        // What each plant label shows. Applied only when the label changes, by
+        // swapping the class of the icons already in the page - no HTML parsing
+        const plantStates = {
+            high: { card: 'alert', iconTone: 'infected', tone: 'infected', icon: 'fa-exclamation-triangle', status: 'HIGH',
+                    subtext: 'Critical severity!', detectionIcon: 'fa-biohazard', detection: 'High Severity' },
+            medium: { card: 'warning', iconTone: 'infected', tone: 'warning', icon: 'fa-exclamation-circle', status: 'MEDIUM',
+                      subtext: 'Moderate severity', detectionIcon: 'fa-exclamation-circle', detection: 'Medium Severity' },
+            low: { card: 'warning', iconTone: 'infected', tone: 'warning', icon: 'fa-bug', status: 'LOW',
+                   subtext: 'Low severity', detectionIcon: 'fa-bug', detection: 'Low Severity' },
+            healthy: { card: null, iconTone: 'healthy', tone: 'healthy', icon: 'fa-check-circle', status: 'HEALTHY',
+                       subtext: 'Plant is healthy', detectionIcon: 'fa-shield-alt', detection: 'Plant Healthy' },
+            none: { card: null, iconTone: null, tone: null, icon: 'fa-search', status: 'NO PLANT',
+                    subtext: 'No plant detected', detectionIcon: 'fa-search', detection: 'No Plant' }
+        };
+
+        function toned(base, tone) {
+            return tone ? `${base} ${tone}` : base;
+        }
+
+        // Spinners rotate through the Web Animations API so each one can be paused
+        // while it is off-screen, and is dropped once its element leaves the page
+        const spinFrames = [{ transform: 'rotate(0deg)' }, { transform: 'rotate(360deg)' }];
+        const spinObserver = new IntersectionObserver(entries => {
+            for (const entry of entries) {
+                const anim = entry.target._spin;
+                if (!entry.target.isConnected) {
+                    anim.cancel();
+                    spinObserver.unobserve(entry.target);
+                } else if (entry.isIntersecting) {
+                    anim.play();
+                } else {
+                    anim.pause();
+                }
+            }
+        });
+
+        function spin(el) {
+            el._spin = el.animate(spinFrames, { duration: 1000, iterations: Infinity });
+            spinObserver.observe(el);
+        }
+
         function updateUI(data) {
-            const plantCard = document.getElementById('plantCard');
-            const plantIcon = document.getElementById('plantIcon');
-            const plantStatus = document.getElementById('plantStatus');
-            const plantSubtext = document.getElementById('plantSubtext');
-            const liveFeedContainer = document.getElementById('liveFeedContainer');
-            const detectionOverlay = document.getElementById('detectionOverlay');
-            const detectionStatus = document.getElementById('detectionStatus');
-            const confidenceScore = document.getElementById('confidenceScore');
-            
             // Parse plant label
-            const plantLabel = (data.plant || '').split(' ')[0].toLowerCase();
-            
-            // Reset classes
-            plantCard.classList.remove('alert', 'warning');
-            plantIcon.className = 'kpi-icon';
-            plantStatus.className = 'kpi-value';
-            liveFeedContainer.className = 'live-feed-container';
-            detectionOverlay.className = 'detection-overlay';
-            detectionStatus.className = 'detection-status';
+            const plantLabel = data.plantLabel;
             
-            // Update based on plant status
-            if (plantLabel === 'high') {
-                plantCard.classList.add('alert');
-                plantIcon.classList.add('infected');
-                plantIcon.innerHTML = '<i class="fas fa-exclamation-triangle"></i>';
-                plantStatus.classList.add('infected');
-                plantStatus.textContent = 'HIGH';
-                plantSubtext.textContent = 'Critical severity!';
-                liveFeedContainer.classList.add('infected');
-                detectionOverlay.classList.add('infected');
-                detectionStatus.innerHTML = '<i class="fas fa-biohazard"></i><span>High Severity</span>';
-                detectionStatus.classList.add('infected');
-            } else if (plantLabel === 'medium') {
-                plantCard.classList.add('warning');
-                plantIcon.classList.add('infected');
-                plantIcon.innerHTML = '<i class="fas fa-exclamation-circle"></i>';
-                plantStatus.classList.add('warning');
-                plantStatus.textContent = 'MEDIUM';
-                plantSubtext.textContent = 'Moderate severity';
-                liveFeedContainer.classList.add('warning');
-                detectionOverlay.classList.add('warning');
-                detectionStatus.innerHTML = '<i class="fas fa-exclamation-circle"></i><span>Medium Severity</span>';
-                detectionStatus.classList.add('warning');
-            } else if (plantLabel === 'low') {
-                plantCard.classList.add('warning');
-                plantIcon.classList.add('infected');
-                plantIcon.innerHTML = '<i class="fas fa-bug"></i>';
-                plantStatus.classList.add('warning');
-                plantStatus.textContent = 'LOW';
-                plantSubtext.textContent = 'Low severity';
-                liveFeedContainer.classList.add('warning');
-                detectionOverlay.classList.add('warning');
-                detectionStatus.innerHTML = '<i class="fas fa-bug"></i><span>Low Severity</span>';
-                detectionStatus.classList.add('warning');
-            } else if (plantLabel === 'healthy') {
-                plantIcon.classList.add('healthy');
-                plantIcon.innerHTML = '<i class="fas fa-check-circle"></i>';
-                plantStatus.classList.add('healthy');
-                plantStatus.textContent = 'HEALTHY';
-                plantSubtext.textContent = 'Plant is healthy';
-                liveFeedContainer.classList.add('healthy');
-                detectionOverlay.classList.add('healthy');
-                detectionStatus.innerHTML = '<i class="fas fa-shield-alt"></i><span>Plant Healthy</span>';
-                detectionStatus.classList.add('healthy');
-            } else {
-                plantIcon.innerHTML = '<i class="fas fa-search"></i>';
-                plantStatus.textContent = 'NO PLANT';
-                plantSubtext.textContent = 'No plant detected';
-                detectionStatus.innerHTML = '<i class="fas fa-search"></i><span>No Plant</span>';
+            if (plantLabel !== lastPlantLabel) {
+                lastPlantLabel = plantLabel;
+                const state = plantStates[plantLabel] || plantStates.none;
+                els.plantCard.className = toned('kpi-card', state.card);
+                els.plantIcon.className = toned('kpi-icon', state.iconTone);
+                els.plantIcon.firstElementChild.className = `fas ${state.icon}`;
+                els.plantStatus.className = toned('kpi-value', state.tone);
+                els.plantStatus.textContent = state.status;
+                els.plantSubtext.textContent = state.subtext;
+                els.liveFeedContainer.className = toned('live-feed-container', state.tone);
+                els.detectionOverlay.className = toned('detection-overlay', state.tone);
+                els.detectionStatus.className = toned('detection-status', state.tone);
+                els.detectionStatus.firstElementChild.className = `fas ${state.detectionIcon}`;
+                const label = els.detectionStatus.lastElementChild;
+                label.removeAttribute('data-i18n');  // Now shows a detection, not the "Analyzing" placeholder
+                label.textContent = state.detection;
             }
             
-            confidenceScore.textContent = `Confidence: ${(data.confidence || 0).toFixed(1)}%`;
+            setNumber(els.confidenceScore, data.confidence || 0, asConfidence);
             
             // Update other cards
-            document.getElementById('confidenceValue').textContent = `${(data.confidence || 0).toFixed(1)}%`;
-            document.getElementById('moistureValue').textContent = `${(data.moisture || 0).toFixed(1)}%`;
-            document.getElementById('tempValue').textContent = data.temperature !== null ? `${data.temperature.toFixed(1)}°C` : '--°C';
-            document.getElementById('humidityValue').textContent = data.humidity !== null ? `${data.humidity.toFixed(1)}%` : '--%';
+            setNumber(els.confidenceValue, data.confidence || 0, asPercent);
+            setNumber(els.moistureValue, data.moisture || 0, asPercent);
+            setNumber(els.tempValue, data.temperature, asCelsius);
+            setNumber(els.humidityValue, data.humidity, asPercent);
             
             // Moisture card status
-            const moistureCard = document.getElementById('moistureCard');
-            const moistureStatus = document.getElementById('moistureStatus');
-            moistureCard.classList.remove('alert', 'warning');
-            if (data.moisture < 30) { 
-                moistureCard.classList.add('alert'); 
-                moistureStatus.textContent = 'Critical - Low!'; 
-            } else if (data.moisture < 40) { 
-                moistureCard.classList.add('warning'); 
-                moistureStatus.textContent = 'Warning - Low'; 
-            } else { 
-                moistureStatus.textContent = 'Optimal level'; 
+            const moistureBand = data.moisture < 30 ? 'alert' : data.moisture < 40 ? 'warning' : 'optimal';
+            if (moistureBand !== lastMoistureBand) {
+                lastMoistureBand = moistureBand;
+                els.moistureCard.className = toned('kpi-card', moistureBand === 'optimal' ? '' : moistureBand);
+                els.moistureStatus.textContent = moistureStates[moistureBand];
             }
             
             // Motor status
-            const motorCard = document.getElementById('motorCard');
-            const motorIconContainer = document.getElementById('motorIconContainer');
-            const motorIcon = document.getElementById('motorIcon');
-            const motorStatus = document.getElementById('motorStatus');
-            const motorSubtext = document.getElementById('motorSubtext');
-            
-            if (data.motor === 'ON') {
-                motorCard.classList.add('alert');
-                motorIconContainer.classList.add('spraying');
-                motorStatus.textContent = 'SPRAYING';
-                motorStatus.style.color = 'var(--emerald-primary)';
-                motorSubtext.textContent = 'Pesticide dispensing...';
-            } else {
-                motorCard.classList.remove('alert');
-                motorIconContainer.classList.remove('spraying');
-                motorStatus.textContent = 'IDLE';
-                motorStatus.style.color = 'var(--text-primary)';
-                motorSubtext.textContent = 'Ready to spray';
+            // Only touch the motor card when the state flips, so the spin
+            // animation isn't restarted and re-styled on every poll
+            const spinning = data.motor === 'ON';
+            if (spinning !== motorSpinning) {
+                motorSpinning = spinning;
+                showMotor(spinning, spinning ? 'Pesticide dispensing...' : 'Ready to spray');
             }
             
             // Update chart with new moisture data
-            if (data.moisture !== lastMoisture) {
-                moistureHistory.push(data.moisture);
-                moistureHistory.shift();
-                moistureChart.data.datasets[0].data = moistureHistory;
-                moistureChart.update('none');
+            if (Math.abs(data.moisture - lastMoisture) >= MOISTURE_CHART_STEP) {
+                pushMoisture(data.moisture);
                 lastMoisture = data.moisture;
             }
         }
 
+        // The card's motor-on class colours the status and spins the pump icon,
+        // so switching the motor display is one class write and two texts
+        function showMotor(spinning, subtext) {
+            els.motorCard.className = toned('kpi-card', spinning ? 'alert motor-on' : '');
+            els.motorStatus.textContent = spinning ? 'SPRAYING' : 'IDLE';
+            els.motorSubtext.textContent = subtext;
+        }
+
         function updateConnectionStatus(isOnline) {
-            const statusDot = document.getElementById('statusDot');
-            const statusText = document.getElementById('statusText');
-            const connectionStatus = document.getElementById('connectionStatus');
+            if (isOnline === shownOnline) return;
+            shownOnline = isOnline;
             
             if (isOnline) {
-                statusDot.classList.remove('offline');
-                statusDot.classList.add('online');
-                statusText.textContent = 'System Online';
-                connectionStatus.style.borderColor = 'rgba(0, 245, 160, 0.2)';
+                els.statusDot.classList.remove('offline');
+                els.statusDot.classList.add('online');
+                els.statusText.textContent = 'System Online';
+                els.connectionStatus.style.borderColor = 'rgba(0, 245, 160, 0.2)';
             } else {
-                statusDot.classList.remove('online');
-                statusDot.classList.add('offline');
-                statusText.textContent = 'System Offline';
-                connectionStatus.style.borderColor = 'rgba(255, 59, 92, 0.3)';
+                els.statusDot.classList.remove('online');
+                els.statusDot.classList.add('offline');
+                els.statusText.textContent = 'System Offline';
+                els.connectionStatus.style.borderColor = 'rgba(255, 59, 92, 0.3)';
             }
         }
 
+        let lastLogId = 0;
+        const logIconMap = {
+            'success': 'fa-check-circle',
+            'info': 'fa-info-circle',
+            'warning': 'fa-exclamation-triangle',
+            'error': 'fa-times-circle'
+        };
+
+        function createLogEntry(log) {
+            const entry = document.createElement('div');
+            entry.className = `log-entry ${log.type}`;
+            const icon = document.createElement('div');
+            icon.className = `log-icon ${log.type}`;
+            const glyph = document.createElement('i');
+            glyph.className = `fas ${logIconMap[log.type] || 'fa-info-circle'}`;
+            icon.appendChild(glyph);
+            const message = document.createElement('div');
+            message.className = 'log-message';
+            message.textContent = log.message;
+            const time = document.createElement('div');
+            time.className = 'log-time';
+            time.textContent = log.time;
+            const text = document.createElement('div');
+            text.append(message, time);
+            entry.append(icon, text);
+            return entry;
+        }
+
+        // /logs only sends entries newer than lastLogId, so just those are
+        // added on top instead of rebuilding the whole list every poll
         function renderLogs(logs) {
-            const container = document.getElementById('logEntries');
-            document.getElementById('logCount').textContent = logs.length;
+            const container = els.logEntries;
+            
+            // Server restarted - its ids start over, so start the list over too
+            if (logs.length > 0 && logs[0].id <= lastLogId) lastLogId = 0;
             
             if (logs.length === 0) {
-                container.innerHTML = `<div class="text-center text-muted py-4"><i class="fas fa-inbox mb-2"></i><p class="small mb-0">No activity yet</p></div>`;
+                // Only put the empty placeholder in once, not on every empty poll
+                if (lastLogId === 0 && !container.querySelector('[data-i18n="no_activity"]')) {
+                    container.innerHTML = `<div class="text-center text-muted py-4"><i class="fas fa-inbox mb-2"></i><p class="small mb-0">No activity yet</p></div>`;
+                }
                 return;
             }
             
-            // Map log types to icons
-            const iconMap = {
-                'success': 'fa-check-circle',
-                'info': 'fa-info-circle',
-                'warning': 'fa-exclamation-triangle',
-                'error': 'fa-times-circle'
-            };
+            // The first entries replace the loading / empty placeholder
+            if (lastLogId === 0) container.textContent = '';
             
-            container.innerHTML = logs.slice().reverse().map(log => `
-                <div class="log-entry ${log.type}">
-                    <div class="log-icon ${log.type}"><i class="fas ${iconMap[log.type] || 'fa-info-circle'}"></i></div>
-                    <div><div class="log-message">${log.message}</div><div class="log-time">${log.time}</div></div>
-                </div>
-            `).join('');
+            const fragment = document.createDocumentFragment();
+            for (let i = logs.length - 1; i >= 0; i--) fragment.appendChild(createLogEntry(logs[i]));
+            container.prepend(fragment);
+            while (container.children.length > 50) container.lastChild.remove();
+            
+            lastLogId = logs[logs.length - 1].id;
+            setText(els.logCount, container.children.length);
         }
 
         // ===================== OVERLAY FUNCTIONS =====================
+        // Parsed overlay bodies, one per overlay type. Reopening an overlay whose
+        // readings haven't changed clones the parsed tree instead of parsing again
+        const overlayBodies = {};
+        function overlayBody(type) {
+            const html = overlayConfig[type].renderContent(currentData);
+            let cached = overlayBodies[type];
+            if (!cached || cached.html !== html) {
+                const template = document.createElement('template');
+                template.innerHTML = html;
+                cached = overlayBodies[type] = { html, content: template.content };
+            }
+            return cached.content;
+        }
+
+        // Hovering a card builds its overlay body while the browser is idle,
+        // so the click usually only has to clone it
+        const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 0));
+        function prepareOverlay(type) {
+            whenIdle(() => overlayBody(type));
+        }
+
         function openOverlay(type) {
             const config = overlayConfig[type];
             if (!config) return;
             
-            const overlay = document.getElementById('techOverlay');
-            const content = document.getElementById('overlayContent');
-            
-            document.getElementById('overlayTitle').textContent = config.title;
-            document.getElementById('overlaySubtitle').textContent = config.subtitle;
-            document.getElementById('overlayIcon').innerHTML = `<i class="fas ${config.icon}"></i>`;
-            document.getElementById('overlayStatus').textContent = config.status;
-            document.getElementById('dataSensor').textContent = config.sensorId;
-            document.getElementById('dataAccuracy').textContent = config.accuracy;
-            document.getElementById('dataUptime').textContent = config.uptime;
-            document.getElementById('dataReading').textContent = new Date().toLocaleTimeString();
+            const overlay = els.techOverlay;
+            const content = els.overlayContent;
             
+            els.overlayTitle.textContent = config.title;
+            els.overlaySubtitle.textContent = config.subtitle;
+            els.overlayIcon.firstElementChild.className = `fas ${config.icon}`;
+            els.overlayStatus.textContent = config.status;
+            els.dataSensor.textContent = config.sensorId;
+            els.dataAccuracy.textContent = config.accuracy;
+            els.dataUptime.textContent = config.uptime;
             const now = new Date();
-            document.getElementById('overlayTimestamp').textContent = now.toISOString().replace('T', ' ').slice(0, 19) + ' UTC';
+            els.dataReading.textContent = now.toLocaleTimeString();
+            els.overlayTimestamp.textContent = now.toISOString().replace('T', ' ').slice(0, 19) + ' UTC';
             
             content.className = 'tech-info-overlay';
             if (config.class) content.classList.add(config.class);
             
-            document.getElementById('overlayContentArea').innerHTML = config.renderContent(currentData);
+            els.overlayContentArea.replaceChildren(overlayBody(type).cloneNode(true));
             
             overlay.classList.add('active');
             document.body.style.overflow = 'hidden';
@@ -1379,24 +1891,42 @@ def dashboard():
 
         function closeOverlay(event) {
             if (event && event.target !== event.currentTarget && event.type === 'click') return;
-            document.getElementById('techOverlay').classList.remove('active');
+            els.techOverlay.classList.remove('active');
             document.body.style.overflow = '';
         }
 
         // ===================== TOAST NOTIFICATIONS =====================
+        // Toast nodes are recycled rather than created and removed for every
+        // message, so a burst of messages doesn't churn the DOM
+        const TOAST_POOL_SIZE = 3;
+        const toastPool = [];
+        // Toasts use the same icons as log entries
+        const toastColors = { success: 'var(--emerald-primary)', error: 'var(--alert-red)', warning: 'var(--warning-amber)', info: 'var(--info-blue)' };
+
         function showToast(message, type = 'success') {
-            const container = document.getElementById('toastContainer');
-            const toast = document.createElement('div');
-            toast.className = `custom-toast ${type}`;
-            const icons = { success: 'fa-check-circle', error: 'fa-times-circle', warning: 'fa-exclamation-triangle', info: 'fa-info-circle' };
-            const colors = { success: 'var(--emerald-primary)', error: 'var(--alert-red)', warning: 'var(--warning-amber)', info: 'var(--info-blue)' };
-            toast.innerHTML = `<i class="fas ${icons[type]}" style="color: ${colors[type]}"></i><span>${message}</span>`;
+            const container = els.toastContainer;
+            let toast = toastPool.find(t => t.hidden);
+            if (!toast) {
+                toast = document.createElement('div');
+                // With every slot busy the extra node is just removed afterwards
+                if (toastPool.length < TOAST_POOL_SIZE) toastPool.push(toast);
+            }
+            toast.hidden = false;
+            toast.style.opacity = '';
+            toast.style.transform = '';
+            toast.className = `custom-toast ${type} entering`;
+            toast.innerHTML = `<i class="fas ${logIconMap[type]}" style="color: ${toastColors[type]}"></i><span>${message}</span>`;
             container.appendChild(toast);
+            // Compositor layer only for the slide-in, not for the toast's whole life
+            toast.addEventListener('animationend', () => toast.classList.remove('entering'), { once: true });
             
             setTimeout(() => {
                 toast.style.opacity = '0';
-                toast.style.transform = 'translateX(100%)';
-                setTimeout(() => toast.remove(), 300);
+                toast.style.transform = 'translate3d(100%, 0, 0)';
+                setTimeout(() => {
+                    if (toastPool.includes(toast)) toast.hidden = true;
+                    else toast.remove();
+                }, 300);
             }, 4000);
         }
 
@@ -1404,60 +1934,108 @@ def dashboard():
         async function forceSpray() {
             if (isSpraying) return;
             
-            const btn = document.getElementById('forceSprayBtn');
+            const btn = els.forceSprayBtn;
             isSpraying = true;
             
             btn.classList.add('spraying');
             btn.innerHTML = '<span class="loading-spinner"></span><span>SPRAYING...</span>';
+            spin(btn.querySelector('.loading-spinner'));
             btn.disabled = true;
             
             // Update motor card UI
-            document.getElementById('motorStatus').textContent = 'SPRAYING';
-            document.getElementById('motorStatus').style.color = 'var(--emerald-primary)';
-            document.getElementById('motorIconContainer').classList.add('spraying');
-            document.getElementById('motorSubtext').textContent = 'Manual spray in progress...';
-            document.getElementById('motorCard').classList.add('alert');
+            showMotor(true, 'Manual spray in progress...');
+            motorSpinning = null;  // Next status update repaints the motor card
             
             // Send API request
-            await sendForceSpray();
+            const sent = await sendForceSpray();
             
-            // Reset after 3 seconds
+            // Reset after 3 seconds, or straight away if the request failed
             setTimeout(() => {
                 isSpraying = false;
                 btn.classList.remove('spraying');
                 btn.innerHTML = '<i class="fas fa-exclamation-triangle"></i><span>FORCE SPRAY</span>';
                 btn.disabled = false;
                 
-                document.getElementById('motorStatus').textContent = 'IDLE';
-                document.getElementById('motorStatus').style.color = 'var(--text-primary)';
-                document.getElementById('motorIconContainer').classList.remove('spraying');
-                document.getElementById('motorSubtext').textContent = 'Ready to spray';
-                document.getElementById('motorCard').classList.remove('alert');
-            }, 3000);
+                showMotor(false, 'Ready to spray');
+                motorSpinning = null;
+            }, sent ? 3000 : 0);
         }
 
         // ===================== INITIALIZATION =====================
-        function init() {
-            // Initial data fetch
-            fetchStatus();
-            fetchLogs();
-            
-            // Set up intervals
-            setInterval(fetchStatus, 1000);  // Status every 1 second
-            setInterval(fetchLogs, 5000);    // Logs every 5 seconds
-            
-            // Connection monitoring
-            setInterval(() => {
-                if (Date.now() - lastFetchTime > 5000) {
-                    updateConnectionStatus(false);
+        // Live updates stop while the tab is hidden, so a background tab
+        // doesn't keep pulling status, logs and camera frames
+        let events = null;
+        const pushedStatus = {};
+        let pollTimer = 0;
+        let pollRun = 0;  // Bumped on start/stop so a poll finishing late doesn't reschedule
+
+        function pollSnapshot(run) {
+            pollTimer = setTimeout(async () => {
+                await fetchSnapshot();
+                if (run === pollRun) pollSnapshot(run);
+            }, pollMs);
+        }
+
+        function startUpdates() {
+            // Gives the (re)connect until the offline threshold to deliver something
+            watchConnection();
+            if (window.EventSource) {
+                // The server pushes status and new log entries as they change.
+                // since= picks the log up where it was when the tab was hidden.
+                events = new EventSource(`/events?since=${lastLogId}`);
+                // Status events after the first carry only the changed fields
+                events.addEventListener('status', (e) => applyStatus(Object.assign(pushedStatus, JSON.parse(e.data))));
+                events.addEventListener('logs', (e) => {
+                    watchConnection();
+                    renderLogs(JSON.parse(e.data));
+                });
+                events.addEventListener('ping', () => {
+                    watchConnection();
+                    updateConnectionStatus(true);
+                });
+                // EventSource reconnects by itself; just show we're offline meanwhile
+                events.onerror = () => updateConnectionStatus(false);
+            } else {
+                pollMs = POLL_MIN_MS;
+                fetchSnapshot();
+                pollSnapshot(++pollRun);
+            }
+            
+            const videoFeed = document.getElementById('videoFeed');
+            if (!videoFeed.hasAttribute('src')) videoFeed.src = '/video_feed';
+        }
+
+        function stopUpdates() {
+            if (events) {
+                events.close();
+                events = null;
+            }
+            pollRun++;
+            clearTimeout(pollTimer);
+            clearTimeout(offlineTimer);
+            snapshotController?.abort();
+            // Dropping src closes the MJPEG connection
+            document.getElementById('videoFeed').removeAttribute('src');
+        }
+
+        function init() {
+            spin(document.getElementById('logSpinner'));
+            startUpdates();
+            document.addEventListener('visibilitychange', () => {
+                document.body.classList.toggle('tab-hidden', document.hidden);
+                if (document.hidden) {
+                    stopUpdates();
+                } else {
+                    startUpdates();
                 }
-            }, 2000);
+            });
             
+            // Connection monitoring
             // Keyboard shortcuts
             document.addEventListener('keydown', (e) => {
                 if (e.key === 'Escape') closeOverlay();
                 if (e.key === ' ' || e.key === 'Enter') {
-                    if (document.getElementById('techOverlay').classList.contains('active')) {
+                    if (els.techOverlay.classList.contains('active')) {
                         closeOverlay();
                     }
                 }
@@ -1470,45 +2048,425 @@ def dashboard():
         }
 
         // Start the application
-        init();
-    </script>
+        // Deferred scripts (Chart.js) have run by DOMContentLoaded
+        document.addEventListener('DOMContentLoaded', () => {
+            initChart();
+            init();
+        });
+"""
+
+# Comments the minifier drops from each kind of asset
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+JS_COMMENT = re.compile(r'^\s*//.*$', re.M)  # Whole-line comments only
+HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+
+def minify_asset(text, comment):
+    """
+    Cheap minifier for the dashboard assets: drops comments, indentation and
+    blank lines. Line breaks are kept, so JS semicolon insertion is unchanged.
+    """
+    text = comment.sub('', text)
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+DASHBOARD_CSS = minify_asset(DASHBOARD_CSS, CSS_COMMENT)
+DASHBOARD_JS = minify_asset(DASHBOARD_JS, JS_COMMENT)
+
+def asset_url(name, text):
+    """URL for a dashboard asset, versioned by a hash of its content"""
+    return f"/assets/{name}?v={hashlib.md5(text.encode('utf-8')).hexdigest()[:8]}"
+
+DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Intelligent Sprayer System | Plant AI Monitor Pro</title>
+    <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <!-- Bootstrap lays out the grid, so it stays render-blocking; icons and fonts load without holding up first paint -->
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link rel="preload" as="style" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css" onload="this.onload=null;this.rel='stylesheet'">
+    <!-- Fetch the solid icon font alongside its stylesheet instead of after it has been parsed -->
+    <link rel="preload" as="font" type="font/woff2" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/webfonts/fa-solid-900.woff2" crossorigin>
+    <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript>
+        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.2/css/all.min.css">
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
+    </noscript>
+    <script defer src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <link rel="stylesheet" href="__DASHBOARD_CSS__">
+<base target="_blank">
+</head>
+<body>
+    <header class="mission-header">
+        <div class="container">
+            <div class="row align-items-center">
+                <div class="col-md-6">
+                    <div class="d-flex align-items-center gap-3">
+                        <i class="fas fa-leaf text-success fs-3"></i>
+                        <div>
+                            <h1 class="project-title mb-0">Plant AI Monitor</h1>
+                            <span class="team-badge">Intelligent Sprayer System Pro</span>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-6 text-md-end mt-3 mt-md-0">
+                    <div class="status-indicator justify-content-md-end" id="connectionStatus">
+                        <span id="statusDot" class="status-dot online"></span>
+                        <span id="statusText">System Online</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </header>
+
+    <main class="container py-4">
+        <!-- KPI Cards -->
+        <div class="row g-3 mb-4">
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card" id="plantCard" onclick="openOverlay('plant')" onpointerenter="prepareOverlay('plant')">
+                    <div class="kpi-icon healthy" id="plantIcon"><i class="fas fa-seedling"></i></div>
+                    <div class="kpi-label">Plant Status</div>
+                    <div class="kpi-value healthy" id="plantStatus">--</div>
+                    <div class="kpi-subtext" id="plantSubtext">Waiting for data...</div>
+                </div>
+            </div>
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card info" onclick="openOverlay('confidence')" onpointerenter="prepareOverlay('confidence')">
+                    <div class="kpi-icon moisture"><i class="fas fa-brain"></i></div>
+                    <div class="kpi-label">AI Confidence</div>
+                    <div class="kpi-value info" id="confidenceValue">--%</div>
+                    <div class="kpi-subtext">Neural Network</div>
+                </div>
+            </div>
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card" id="moistureCard" onclick="openOverlay('moisture')" onpointerenter="prepareOverlay('moisture')">
+                    <div class="kpi-icon moisture"><i class="fas fa-tint"></i></div>
+                    <div class="kpi-label">Soil Moisture</div>
+                    <div class="kpi-value info" id="moistureValue">--%</div>
+                    <div class="kpi-subtext" id="moistureStatus">Waiting...</div>
+                </div>
+            </div>
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card" onclick="openOverlay('temperature')" onpointerenter="prepareOverlay('temperature')">
+                    <div class="kpi-icon temperature"><i class="fas fa-thermometer-half"></i></div>
+                    <div class="kpi-label">Temperature</div>
+                    <div class="kpi-value warning" id="tempValue">--°C</div>
+                    <div class="kpi-subtext">Ambient</div>
+                </div>
+            </div>
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card info" onclick="openOverlay('humidity')" onpointerenter="prepareOverlay('humidity')">
+                    <div class="kpi-icon humidity"><i class="fas fa-water"></i></div>
+                    <div class="kpi-label">Humidity</div>
+                    <div class="kpi-value info" id="humidityValue">--%</div>
+                    <div class="kpi-subtext">Air Moisture</div>
+                </div>
+            </div>
+            <div class="col-6 col-md-4 col-lg-2">
+                <div class="kpi-card" id="motorCard" onclick="openOverlay('motor')" onpointerenter="prepareOverlay('motor')">
+                    <div class="kpi-icon pump" id="motorIconContainer"><i class="fas fa-cog" id="motorIcon"></i></div>
+                    <div class="kpi-label">Motor Status</div>
+                    <div class="kpi-value" id="motorStatus">IDLE</div>
+                    <div class="kpi-subtext" id="motorSubtext">Ready</div>
+                </div>
+            </div>
+        </div>
+
+        <!-- FORCE SPRAY SECTION -->
+        <div class="force-spray-section">
+            <div class="row align-items-center">
+                <div class="col-md-8">
+                    <div class="d-flex align-items-center gap-3">
+                        <div class="kpi-icon infected" style="margin-bottom: 0;"><i class="fas fa-exclamation-triangle"></i></div>
+                        <div>
+                            <h5 class="mb-1" style="color: var(--alert-red); text-shadow: 0 0 10px rgba(255, 59, 92, 0.3);"><i class="fas fa-spray-can me-2"></i>Manual Override Control</h5>
+                            <p class="mb-0 text-muted small">Emergency spray activation - Triggers 3-second spray regardless of conditions</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-4 mt-3 mt-md-0">
+                    <button class="force-spray-btn" id="forceSprayBtn" onclick="forceSpray()">
+                        <i class="fas fa-exclamation-triangle"></i><span>FORCE SPRAY</span>
+                    </button>
+                </div>
+            </div>
+        </div>
+
+        <!-- LIVE CAMERA & AUTO-SPRAY DURATION ROW -->
+        <div class="row g-4 mb-4">
+            <div class="col-lg-8">
+                <div class="operation-panel">
+                    <div class="panel-header">
+                        <i class="fas fa-video"></i>
+                        <h5>Live Camera Feed (HD 720p)</h5>
+                        <span class="badge bg-danger ms-auto">LIVE</span>
+                    </div>
+                    <div class="p-3">
+                        <div class="live-feed-container" id="liveFeedContainer">
+                            <img id="videoFeed" src="/video_feed" width="960" height="540" loading="eager" decoding="async" class="w-100 h-100 object-fit-cover" alt="Live Feed">
+                            <span class="live-badge">LIVE</span>
+                            <div class="detection-overlay" id="detectionOverlay">
+                                <div class="detection-status" id="detectionStatus"><i class="fas fa-search"></i><span>Analyzing...</span></div>
+                                <span class="confidence-score" id="confidenceScore">--</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            <div class="col-lg-4">
+                <div class="spray-duration-panel">
+                    <div class="d-flex align-items-center gap-2 mb-3">
+                        <i class="fas fa-clock" style="color: var(--emerald-primary);"></i>
+                        <h6 class="mb-0" style="color: var(--text-primary); font-weight: 700; text-transform: uppercase; letter-spacing: 1px;">Auto-Spray Durations</h6>
+                    </div>
+                    <p class="text-muted small mb-3">Automatic spray duration based on detected severity level</p>
+                    <div class="duration-item low">
+                        <div class="d-flex align-items-center gap-2"><span class="duration-badge low">LOW</span><span class="text-muted small">Mild Detection</span></div>
+                        <span class="duration-time" style="color: var(--warning-amber);">2s</span>
+                    </div>
+                    <div class="duration-item medium">
+                        <div class="d-flex align-items-center gap-2"><span class="duration-badge medium">MED</span><span class="text-muted small">Moderate Detection</span></div>
+                        <span class="duration-time" style="color: #f97316;">3s</span>
+                    </div>
+                    <div class="duration-item high">
+                        <div class="d-flex align-items-center gap-2"><span class="duration-badge high">HIGH</span><span class="text-muted small">Severe Detection</span></div>
+                        <span class="duration-time" style="color: var(--alert-red);">5s</span>
+                    </div>
+                    <div class="mt-3 p-2 rounded" style="background: rgba(0, 245, 160, 0.05); border: 1px solid rgba(0, 245, 160, 0.1);">
+                        <small class="text-muted" style="font-size: 0.75rem;"><i class="fas fa-info-circle me-1" style="color: var(--emerald-primary);"></i>System automatically adjusts spray duration based on AI analysis confidence</small>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- CENTER CHART SECTION -->
+        <div class="row mb-4">
+            <div class="col-12 below-fold">
+                <div class="chart-container">
+                    <div class="d-flex align-items-center justify-content-between mb-3">
+                        <h5 class="mb-0" style="color: var(--text-primary); font-weight: 700;"><i class="fas fa-chart-area me-2" style="color: var(--emerald-primary);"></i>Soil Moisture History Analysis</h5>
+                        <div class="d-flex gap-2">
+                            <span class="badge" style="background: rgba(0, 245, 160, 0.2); color: var(--emerald-primary);"><i class="fas fa-circle me-1" style="font-size: 0.5rem;"></i>Live Data</span>
+                            <span class="text-muted small">Last 30 readings</span>
+                        </div>
+                    </div>
+                    <canvas id="moistureChart"></canvas>
+                </div>
+            </div>
+        </div>
+
+        <!-- ACTIVITY LOG SECTION -->
+        <div class="row">
+            <div class="col-12 below-fold">
+                <div class="activity-log">
+                    <div class="log-header">
+                        <i class="fas fa-terminal"></i>
+                        <h6>System Activity Log</h6>
+                        <span class="badge bg-secondary ms-auto" id="logCount">0</span>
+                    </div>
+                    <div class="log-entries" id="logEntries">
+                        <div class="text-center text-muted py-4"><i class="fas fa-circle-notch mb-2" id="logSpinner"></i><p class="small mb-0">Loading logs...</p></div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </main>
+
+    <div class="toast-container" id="toastContainer"></div>
+
+    <div class="tech-overlay-backdrop" id="techOverlay" onclick="closeOverlay(event)">
+        <div class="tech-info-overlay" id="overlayContent" onclick="event.stopPropagation()">
+            <div class="tech-corner tech-corner-tl"></div><div class="tech-corner tech-corner-tr"></div>
+            <div class="tech-corner tech-corner-bl"></div><div class="tech-corner tech-corner-br"></div>
+            <div class="tech-overlay-header">
+                <div class="tech-overlay-icon" id="overlayIcon"><i class="fas fa-leaf"></i></div>
+                <div class="tech-overlay-title-group">
+                    <div class="tech-overlay-title" id="overlayTitle">Sensor Details</div>
+                    <div class="tech-overlay-subtitle" id="overlaySubtitle">Technical Diagnostics</div>
+                </div>
+                <button class="tech-overlay-close" onclick="closeOverlay()"><i class="fas fa-times"></i></button>
+            </div>
+            <div class="tech-overlay-content" id="overlayContentArea"></div>
+            <div class="tech-data-grid" id="overlayDataGrid">
+                <div class="tech-data-item"><div class="tech-data-label">Last Reading</div><div class="tech-data-value" id="dataReading">--</div></div>
+                <div class="tech-data-item"><div class="tech-data-label">Sensor ID</div><div class="tech-data-value" id="dataSensor">--</div></div>
+                <div class="tech-data-item"><div class="tech-data-label">Accuracy</div><div class="tech-data-value" id="dataAccuracy">--</div></div>
+                <div class="tech-data-item"><div class="tech-data-label">Uptime</div><div class="tech-data-value" id="dataUptime">--</div></div>
+            </div>
+            <div class="tech-overlay-footer">
+                <span class="tech-status-badge" id="overlayStatus">Operational</span>
+                <span class="tech-timestamp" id="overlayTimestamp">--</span>
+            </div>
+        </div>
+    </div>
+
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="__DASHBOARD_JS__"></script>
 </body>
 </html>
 
-"""
+""".replace(
+    '__DASHBOARD_CSS__', asset_url('dashboard.css', DASHBOARD_CSS)).replace(
+    '__DASHBOARD_JS__', asset_url('dashboard.js', DASHBOARD_JS))
+DASHBOARD_HTML = minify_asset(DASHBOARD_HTML, HTML_COMMENT)
+DASHBOARD_GZ = gzip.compress(DASHBOARD_HTML.encode('utf-8'), compresslevel=6)
+DASHBOARD_CSS_GZ = gzip.compress(DASHBOARD_CSS.encode('utf-8'), compresslevel=6)
+DASHBOARD_JS_GZ = gzip.compress(DASHBOARD_JS.encode('utf-8'), compresslevel=6)
+
+# Asset URLs change whenever their content does, so they never need revalidating
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+def gzip_response(body, body_gz, mimetype, cache_control):
+    """Sends the pre-gzipped copy of body when the client accepts gzip"""
+    headers = {'Cache-Control': cache_control, 'Vary': 'Accept-Encoding'}
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(body_gz, mimetype=mimetype, headers=headers)
+    return Response(body, mimetype=mimetype, headers=headers)
+
+@app.route('/')
+def dashboard():
+    return gzip_response(DASHBOARD_HTML, DASHBOARD_GZ, 'text/html', 'public, max-age=3600')
+
+@app.route('/assets/dashboard.css')
+def dashboard_css():
+    return gzip_response(DASHBOARD_CSS, DASHBOARD_CSS_GZ, 'text/css', ASSET_CACHE_CONTROL)
+
+@app.route('/assets/dashboard.js')
+def dashboard_js():
+    return gzip_response(DASHBOARD_JS, DASHBOARD_JS_GZ, 'application/javascript', ASSET_CACHE_CONTROL)
 
 @app.route('/video_feed')
 def video_feed():
-    return Response(generate_frames(),
-                    mimetype='multipart/x-mixed-replace; boundary=frame')
+    return slotted_stream(generate_frames(), 'multipart/x-mixed-replace; boundary=frame')
 
-@app.route('/status')
-def status():
-    return jsonify({
+def current_status():
+    """Dashboard status, shared by /status, /snapshot and /events"""
+    plant = latest_plant_data  # One consistent snapshot
+    return {
         "motor": "ON" if motor_state else "OFF",
-        "plant": latest_plant_data["label"],
-        "confidence": round(latest_plant_data["confidence"], 1),
+        "plant": plant["label"],
+        "confidence": round(plant["confidence"], 1),
         "moisture": latest_moisture,
         "temperature": latest_temperature,
         "humidity": latest_humidity
-    })
+    }
+
+def status_hash(data):
+    """Hash of a current_status() dict, for ETags - cheaper than serializing it just to find nothing changed"""
+    return hash(tuple(data.values())) & 0xffffffffffffffff
+
+# (etag, body) of the last /status response. Fresh page loads and clients
+# without the ETag get the same bytes again while the status is unchanged.
+last_status_body = (None, b"")
+
+@app.route('/status')
+def status():
+    global last_status_body
+    data = current_status()
+    etag = f'"{ETAG_PREFIX}-{status_hash(data):x}"'
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    cached_etag, body = last_status_body
+    if cached_etag != etag:
+        body = orjson.dumps(data)  # Always under COMPRESS_MIN_SIZE, so never gzipped
+        last_status_body = (etag, body)
+    return with_etag(Response(body, mimetype='application/json'), etag)
+
+@app.route('/snapshot')
+def snapshot():
+    """
+    Status plus the log entries newer than ?since=<id> in one response, for
+    dashboards that poll because the browser has no EventSource
+    """
+    data = current_status()
+    since = request.args.get('since', 0, type=int)
+    logs = list(system_logs)
+    if logs and since > logs[-1]["id"]:
+        since = 0  # Server restarted since the browser's last poll
+
+    etag = f'"{ETAG_PREFIX}-{status_hash(data):x}-{logs[-1]["id"] if logs else 0}"'
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    return with_etag(fastjson({"status": data, "logs": [log for log in logs if log["id"] > since]}), etag)
+
+@app.route('/events')
+def events():
+    """
+    Server-sent events for the dashboard: a status event with the fields that
+    changed whenever the status changes, and a logs event with each batch of
+    new log entries, instead of the browser polling /status and /logs.
+    """
+    # On reconnect the browser sends the last log id it received; a dashboard
+    # resuming from a hidden tab passes it as ?since=
+    last_log_id = request.headers.get('Last-Event-ID', request.args.get('since', 0, type=int), type=int)
+
+    def stream():
+        nonlocal last_log_id
+        last_status = None
+        last_sent = time.monotonic()
+        while True:
+            # Runs once before the first wait, so a dashboard returning from
+            # a hidden tab gets the current status straight away
+            status = current_status()
+            if status != last_status:
+                # Full status on connect, then only the fields that changed
+                delta = status if last_status is None else {k: v for k, v in status.items() if v != last_status[k]}
+                last_status = status
+                last_sent = time.monotonic()
+                yield b"event: status\ndata: " + orjson.dumps(delta) + b"\n\n"
+
+            logs = list(system_logs)
+            if logs and last_log_id > logs[-1]["id"]:
+                last_log_id = 0  # Server restarted since the browser's last event
+            new_logs = [log for log in logs if log["id"] > last_log_id]
+            if new_logs:
+                last_log_id = new_logs[-1]["id"]
+                last_sent = time.monotonic()
+                yield b"id: %d\nevent: logs\ndata: " % last_log_id + orjson.dumps(new_logs) + b"\n\n"
+
+            # Heartbeat so the dashboard can tell a quiet system from a dead one
+            if time.monotonic() - last_sent >= SSE_HEARTBEAT:
+                last_sent = time.monotonic()
+                yield b"event: ping\ndata: {}\n\n"
+
+            # Woken by new logs and sensor data; the timeout picks up
+            # plant detection changes at most once a second
+            with dashboard_update:
+                dashboard_update.wait(timeout=1.0)
+
+    return slotted_stream(stream(), 'text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 @app.route('/force_spray', methods=['POST'])
 def force():
     global force_spray
-    force_spray = True
+    with spray_lock:
+        force_spray = True
     add_log("Force spray requested from dashboard", "warning")
-    return jsonify({"status": "activated"})
+    return fastjson({"status": "activated"})
 
 # ------------------------------
 # Camera and Thread Functions
 # ------------------------------
 def capture_frames():
+    # cap.read() blocks until the camera has a new frame, so there is no
+    # sleep here; put_latest keeps only the newest frame for the pipeline.
+    # Each read returns a freshly allocated array that nothing else holds,
+    # so it is handed on as-is rather than copied first.
     while True:
         ret, frame = cap.read()
         if ret:
-            frame_buffer.append(frame.copy())
-        time.sleep(0.01)
+            put_latest(frame_buffer, frame)
+        else:
+            time.sleep(0.1)  # Camera gone — reconnecting takes seconds, so check back slowly
 
 def monitor_camera():
     global cap
@@ -1550,7 +2508,9 @@ if __name__ == '__main__':
     add_log(f"AI Analysis Zone: {TARGET_SIZE}x{TARGET_SIZE} center ROI", "info")
     
     # Start processing threads
+    threading.Thread(target=preprocess_frames, daemon=True).start()
     threading.Thread(target=process_frame, daemon=True).start()
+    threading.Thread(target=encode_frames, daemon=True).start()
     threading.Thread(target=capture_frames, daemon=True).start()
     threading.Thread(target=monitor_camera, daemon=True).start()
     
@@ -1561,8 +2521,24 @@ if __name__ == '__main__':
     print(" Dashboard: http://localhost:5000")
     print("======================================")
     
+    # Werkzeug answers as HTTP/1.0 by default and closes the socket after
+    # every response; HTTP/1.1 lets the Pi clients keep their connection open
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"
+
+    try:
+        # waitress, when installed, serves from a fixed thread pool instead of
+        # starting a thread per request. Each open dashboard holds two of
+        # them (/events and /video_feed); MAX_STREAMS caps those below the
+        # pool size, so the Pi's POSTs always find a free thread.
+        from waitress import serve
+    except ImportError:
+        serve = None
+
     try:
-        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+        if serve:
+            serve(app, host='0.0.0.0', port=5000, threads=WSGI_THREADS)
+        else:
+            app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
     except KeyboardInterrupt:
         print("\nShutting down system...")
         add_log("System shutdown initiated", "warning")
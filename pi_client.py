@@ -1,8 +1,12 @@
 import io
 import time
+import queue
 import logging
+import statistics
 import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, Response
 from gpiozero import OutputDevice
 import picamera
@@ -20,6 +24,26 @@ SERVER_URL = f"http://{LAPTOP_IP}:5000/process"
 
 RELAY_GPIO_PIN = 18  # GPIO 18 controls the water pump relay (physical pin 12)
 
+# At or above this moisture the laptop never auto-sprays (its MOISTURE_THRESHOLD)
+OPTIMAL_MOISTURE = 40.0  # %
+# While moisture is optimal, only send when it moved at least this much...
+MOISTURE_DELTA = 0.5     # %
+# ...or when this long has passed since the last send, in seconds. Kept
+# short because a dashboard force spray only reaches the Pi in a reply.
+KEEPALIVE_INTERVAL = 2
+
+
+# -------------------------------------------------------
+# HTTP session — keeps one connection open to the laptop
+# -------------------------------------------------------
+# A plain requests.post opens and closes a new TCP connection every time.
+# Reusing one Session lets every POST after the first skip the handshake.
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+
+# Body is pre-encoded with orjson, so the content type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 # -------------------------------------------------------
 # Hardware setup
@@ -34,6 +58,11 @@ i2c_bus = busio.I2C(board.SCL, board.SDA)
 ads = ADS.ADS1115(i2c_bus)
 moisture_channel = AnalogIn(ads, ADS.P0)  # Moisture sensor plugged into channel 0
 
+# ADC reads taken per moisture reading; their median drops single noisy spikes
+MOISTURE_SAMPLES = 8
+# 26000 is roughly the max dry reading from our sensor — calibrate if needed
+MOISTURE_DRY_RAW = 26000
+
 
 # -------------------------------------------------------
 # Flask app — used to stream the Pi camera video feed
@@ -44,23 +73,67 @@ logging.basicConfig(level=logging.INFO)
 # Holds the latest moisture reading so we can share it between threads
 current_moisture = 0.0
 
+# Turns the motor off when the current spray is over. Nothing is sent to
+# the laptop while it runs (see sensor_and_motor_loop), but a timer rather
+# than a blocking sleep keeps the sensor loop reading moisture meanwhile,
+# and stops the pump on time even if a reading or the last POST was slow.
+spray_timer = None
+
+
+def stop_motor():
+    """Called by spray_timer once the spray duration has passed."""
+    motor.off()
+    logging.info("Motor OFF")
+
+
+def spraying():
+    """True while a timed spray is still running."""
+    return spray_timer is not None and spray_timer.is_alive()
+
 
 def read_soil_moisture():
     """
-    Reads the raw ADC value and converts it into a percentage.
-    The sensor gives higher voltage when dry and lower when wet,
-    so we invert it: moisture% = 100 - (raw / max * 100)
+    Reads the raw ADC value a few times and converts the median into a
+    percentage. The sensor gives higher voltage when dry and lower when
+    wet, so we invert it: moisture% = 100 - (raw / max * 100)
     """
     global current_moisture
 
-    raw_value = moisture_channel.value
-    # 26000 is roughly the max dry reading from our sensor — calibrate if needed
-    moisture_pct = round(100 - (raw_value / 26000 * 100), 1)
+    raw_value = statistics.median_low(moisture_channel.value for _ in range(MOISTURE_SAMPLES))
+    moisture_pct = round(100 - raw_value * (100 / MOISTURE_DRY_RAW), 1)
 
     # Clamp between 0 and 100 just in case sensor reads weird
     current_moisture = max(0.0, min(100.0, moisture_pct))
 
 
+class JpegFrameSink(io.RawIOBase):
+    """
+    Output for the camera's MJPEG encoder. The GPU hands over each JPEG
+    in one or more writes; once a frame's end marker arrives the whole
+    frame is kept, replacing any frame the stream hasn't sent yet.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.frames = queue.Queue(maxsize=1)
+        self.parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, buf):
+        self.parts.append(bytes(buf))
+        if self.parts[-1].endswith(b'\xff\xd9'):  # JPEG end-of-image marker
+            frame = b''.join(self.parts)
+            self.parts = []
+            try:
+                self.frames.get_nowait()  # Drop the stale frame
+            except queue.Empty:
+                pass
+            self.frames.put_nowait(frame)
+        return len(buf)
+
+
 def camera_stream():
     """
     Opens the Pi camera and yields JPEG frames in MJPEG format.
@@ -77,18 +150,18 @@ def camera_stream():
             # Give the camera a moment to warm up and auto-adjust
             time.sleep(3)
 
-            frame_buffer = io.BytesIO()
-            for _ in cam.capture_continuous(frame_buffer, 'jpeg', use_video_port=True, quality=50):
-                frame_buffer.seek(0)
-                frame_bytes = frame_buffer.read()
-
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-
-                # Reset the buffer for next frame
-                frame_buffer.seek(0)
-                frame_buffer.truncate()
-                time.sleep(0.02)
+            # The GPU encodes MJPEG straight into the sink at the camera's
+            # frame rate, so there is no per-frame capture call or sleep here
+            sink = JpegFrameSink()
+            cam.start_recording(sink, format='mjpeg', quality=50)
+            try:
+                while True:
+                    frame_bytes = sink.frames.get()
+                    yield (b'--frame\r\n'
+                           b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+            finally:
+                # Client went away — stop the encoder before the camera closes
+                cam.stop_recording()
 
     except Exception as e:
         logging.error(f"Camera error: {e}")
@@ -107,18 +180,43 @@ def sensor_and_motor_loop():
     """
     Main loop that runs in a background thread:
     1. Reads soil moisture from ADS1115
-    2. Sends it to the laptop server
+    2. Sends it to the laptop server (wet soil only on a change or keepalive)
     3. Receives motor command
     4. Controls the pump accordingly
     """
+    global spray_timer
+
+    # Last reading the laptop actually got
+    last_sent_moisture = None
+    last_sent_time = 0.0
+
     while True:
         read_soil_moisture()
 
-        payload = {"moisture": current_moisture}
+        # The laptop isn't asked anything while the pump runs. Its answer
+        # would be a RUN the Pi can't act on, logged as another auto-trigger,
+        # and answering would use up a force spray pressed meanwhile.
+        if spraying():
+            time.sleep(1)
+            continue
+
+        optimal = current_moisture >= OPTIMAL_MOISTURE
+
+        # With wet soil the answer is STOP unless someone pressed force spray,
+        # so unchanged readings are skipped and the keepalive picks that up
+        if (optimal and last_sent_moisture is not None
+                and abs(current_moisture - last_sent_moisture) < MOISTURE_DELTA
+                and time.monotonic() - last_sent_time < KEEPALIVE_INTERVAL):
+            time.sleep(1)
+            continue
+
+        payload = orjson.dumps({"moisture": current_moisture})
+        last_sent_moisture = current_moisture
+        last_sent_time = time.monotonic()
 
         try:
-            response = requests.post(SERVER_URL, json=payload, timeout=2)
-            result = response.json()
+            response = session.post(SERVER_URL, data=payload, headers=JSON_HEADERS, timeout=2)
+            result = orjson.loads(response.content)
 
             command = result.get("motor_command")
             run_for = result.get("duration", 0)
@@ -128,16 +226,17 @@ def sensor_and_motor_loop():
             if command == "RUN" and run_for > 0:
                 motor.on()
                 logging.info(f"Motor ON for {run_for}s")
-                time.sleep(run_for)
-                motor.off()
-                logging.info("Motor OFF")
+                spray_timer = threading.Timer(run_for, stop_motor)
+                spray_timer.daemon = True
+                spray_timer.start()
             else:
                 # Make sure motor is off if not supposed to run
                 motor.off()
 
         except Exception as e:
             logging.error(f"Failed to reach server: {e}")
-            motor.off()  # Safety — always turn off motor if connection fails
+            # Safety — turn off motor if connection fails
+            motor.off()
 
         time.sleep(1)  # Wait 1 second before next reading
 